@@ -308,8 +308,8 @@ class FileBasedAutomatedMonitoring:
             self.stats["duns_list"] = self.duns_list
             
             stats_file = Path("./monitoring_stats_file.json")
-            with open(stats_file, 'w') as f:
-                json.dump(self.stats, f, indent=2, default=str)
+            # Serialize in memory and write once rather than in many small chunks
+            stats_file.write_text(json.dumps(self.stats, indent=2, default=str))
                 
         except Exception as e:
             logger.error("Error saving monitoring stats", error=str(e))
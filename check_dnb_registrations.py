@@ -47,9 +47,8 @@ async def check_dnb_registrations():
         # This would use the pull client to check existing registrations
         
         # For now, let's check if we can authenticate and call the API
-        auth_test = await asyncio.get_event_loop().run_in_executor(
-            None, service.authenticator.get_token
-        )
+        # Only a token refresh leaves the event loop
+        auth_test = await service.authenticator.get_token_async()
         
         if auth_test:
             print("✅ Successfully authenticated with D&B API")
@@ -57,7 +56,7 @@ async def check_dnb_registrations():
             # Try to call the API endpoint that lists registrations
             try:
                 endpoint = "/v1/monitoring/registrations"
-                response = await asyncio.get_event_loop().run_in_executor(
+                response = await asyncio.get_running_loop().run_in_executor(
                     None, service.api_client.get, endpoint
                 )
                 
@@ -12,11 +12,11 @@ local files and SFTP servers simultaneously.
 
 import asyncio
 import json
+import os
 import sys
-import time
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Any, Iterator, Optional, Tuple
 
 # Add the src directory to Python path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
@@ -27,15 +27,69 @@ from traceone_monitoring.services.monitoring_service import (
     log_notification_handler
 )
 from traceone_monitoring.utils.config import init_config
-from traceone_monitoring.models.notification import Notification
+from traceone_monitoring.utils.event_loop import install_uvloop
+from traceone_monitoring.models.notification import (
+    Notification,
+    NotificationElement,
+    NotificationType,
+    Organization
+)
+
+
+# Pause between notifications so the output can be followed live
+_DEMO_SLOW = os.environ.get("DEMO_SLOW") == "1"
+
+# Maximum notifications waiting for the storage writer task
+_WRITE_QUEUE_SIZE = 1024
+
+# Above this many mocks, generate column-wise without per-notification output
+_BULK_MOCK_THRESHOLD = 1000
+
+# Reused encoder for the stored-file content previews
+_PREVIEW_ENCODER = json.JSONEncoder(indent=2)
+
+
+def _scan_json_files(base_path: str) -> Iterator[Tuple[str, int, str]]:
+    """
+    Recursively yield (relative path, size, full path) for JSON files
+    
+    Uses os.scandir so each entry's cached stat result is reused instead of
+    issuing a fresh stat() and building a Path object per file.
+    """
+    prefix_len = len(os.path.join(base_path, ""))
+    stack = [base_path]
+    
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".json") and entry.is_file(follow_symlinks=False):
+                    yield entry.path[prefix_len:], entry.stat(follow_symlinks=False).st_size, entry.path
+
+
+def _json_preview(data: Any, limit: int) -> str:
+    """Pretty-print only the first `limit` characters of a JSON document"""
+    chunks = []
+    size = 0
+    for chunk in _PREVIEW_ENCODER.iterencode(data):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= limit:
+            break
+    return "".join(chunks)[:limit]
 
 
 class MultiStorageDemo:
     """Demo class showcasing multi-storage notification handling"""
     
-    def __init__(self, config_path: str):
+    def __init__(self, config_path: str, prewarm: bool = True, max_listed_files: int = 10):
         self.config_path = config_path
+        self.prewarm = prewarm
+        self.max_listed_files = max_listed_files
         self.service = None
+        self._write_queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
         self.demo_notifications_created = 0
     
     async def initialize_service(self) -> bool:
@@ -54,6 +108,10 @@ class MultiStorageDemo:
             self.service = DNBMonitoringService.from_config(self.config_path)
             print("✓ Monitoring service created")
             
+            # Bounded queue + writer task keep storage writes off the producer path
+            self._write_queue = asyncio.Queue(maxsize=_WRITE_QUEUE_SIZE)
+            self._writer_task = asyncio.create_task(self._writer_loop())
+            
             # Test storage connections
             await self.test_storage_connections()
             
@@ -73,6 +131,8 @@ class MultiStorageDemo:
                 connection_test = self.service._sftp_handler.test_connection()
                 if connection_test:
                     print("✓ SFTP connection successful")
+                    if self.prewarm and self.service._sftp_handler.warm_up():
+                        print("✓ SFTP connection pre-warmed")
                 else:
                     print("⚠ SFTP connection failed (may not be available)")
             except Exception as e:
@@ -86,6 +146,8 @@ class MultiStorageDemo:
                 local_test = self.service._local_storage_handler.test_connection()
                 if local_test:
                     print("✓ Local file storage connection successful")
+                    if self.prewarm and self.service._local_storage_handler.warm_up():
+                        print("✓ Local file storage pre-warmed")
                 else:
                     print("✗ Local file storage connection failed")
             except Exception as e:
@@ -120,85 +182,61 @@ class MultiStorageDemo:
     
     def create_mock_notifications(self, registration_ref: str, count: int = 3) -> List[Notification]:
         """Create mock notifications for demonstration"""
+        if count >= _BULK_MOCK_THRESHOLD:
+            return self.create_mock_notifications_bulk(registration_ref, count)
+        
         print(f"\n=== Creating {count} Mock Notifications ===")
         
         notifications = []
         
+        # Build the element shapes once and copy them per DUNS below
+        template_timestamp = datetime.now()
+        name_element_template = NotificationElement(
+            element="organization.primaryName",
+            timestamp=template_timestamp
+        )
+        locality_element_template = NotificationElement(
+            element="organization.primaryAddress.addressLocality.name",
+            current="Demo City",
+            previous="Old City",
+            timestamp=template_timestamp
+        )
+        
         for i in range(count):
-            # Create mock notification data that matches the expected structure
-            notification_data = {
-                "duns": f"12345678{i}",
-                "transactionDetail": {
-                    "duns": f"12345678{i}",
-                    "transactionID": f"mock_txn_{int(time.time())}_{i}",
-                    "transactionTimestamp": datetime.now().isoformat()
-                },
-                "changeTransactionInformation": {
-                    "changeTransactionID": f"change_{int(time.time())}_{i}",
-                    "changeTransactionTimestamp": datetime.now().isoformat()
-                },
-                "organization": {
-                    "primaryName": f"Mock Company {i+1}",
-                    "dunsNumber": f"12345678{i}",
-                    "primaryAddress": {
-                        "streetAddress": {
-                            "line1": f"{100 + i} Demo Street"
-                        },
-                        "addressLocality": {
-                            "name": "Demo City"
-                        },
-                        "addressRegion": {
-                            "name": "Demo State"
-                        },
-                        "postalCode": f"1234{i}",
-                        "addressCountry": {
-                            "name": "United States"
-                        }
-                    }
-                },
-                "registrationDetails": {
-                    "registrationReference": registration_ref,
-                    "candidateDetails": [
-                        {
-                            "duns": f"12345678{i}",
-                            "primaryName": f"Mock Company {i+1}"
-                        }
-                    ]
-                }
-            }
-            
-            # Convert to Notification object (this will create a proper notification)
-            # For demo purposes, we'll create a simple notification structure
-            from traceone_monitoring.models.notification import NotificationType, NotificationElement, Organization
+            duns = f"{123456780 + i:09d}"
+            company_name = f"Mock Company {i+1}"
+            now = datetime.now()
             
-            # Create notification elements with the correct structure
+            # Create notification elements from the prebuilt templates
             elements = [
-                NotificationElement(
-                    element="organization.primaryName",
-                    current=f"Mock Company {i+1}",
-                    previous=f"Old Company {i+1}",
-                    timestamp=datetime.now()
-                ),
-                NotificationElement(
-                    element="organization.primaryAddress.addressLocality.name",
-                    current="Demo City",
-                    previous="Old City",
-                    timestamp=datetime.now()
-                )
+                name_element_template.copy(update={
+                    "current": company_name,
+                    "previous": f"Old Company {i+1}",
+                    "timestamp": now
+                }),
+                locality_element_template.copy(update={"timestamp": now})
             ]
             
-            # Create organization object
-            organization = Organization(
-                duns=f"12345678{i}"
-            )
-            
-            # Create the notification
-            notification = Notification(
-                type=NotificationType.UPDATE,
-                organization=organization,
-                elements=elements,
-                deliveryTimeStamp=datetime.now()
-            )
+            if not notifications:
+                # Validate the first notification fully so a shape error surfaces
+                organization = Organization(
+                    duns=duns
+                )
+                notification = Notification(
+                    type=NotificationType.UPDATE,
+                    organization=organization,
+                    elements=elements,
+                    deliveryTimeStamp=now
+                )
+            else:
+                # Remaining mocks share the validated shape; skip field validation
+                organization = Organization.construct(duns=duns)
+                notification = Notification.construct(
+                    type=NotificationType.UPDATE,
+                    organization=organization,
+                    elements=elements,
+                    delivery_timestamp=now
+                )
             
             # Store registration reference in internal dict for storage grouping
             # The handler will use this to group notifications
@@ -209,6 +247,66 @@ class MultiStorageDemo:
         self.demo_notifications_created += count
         return notifications
     
+    def create_mock_notifications_bulk(self, registration_ref: str, count: int) -> List[Notification]:
+        """
+        Create a large number of mock notifications for stress testing
+        
+        Column-wise generation: DUNS, names and elements are built in flat
+        comprehensions with a single shared timestamp, and only the first
+        notification is validated. Per-notification output is skipped.
+        """
+        print(f"\n=== Creating {count} Mock Notifications (bulk) ===")
+        
+        now = datetime.now()
+        duns_column = [f"{123456780 + i:09d}" for i in range(count)]
+        name_element = NotificationElement(
+            element="organization.primaryName",
+            timestamp=now
+        )
+        locality_element = NotificationElement(
+            element="organization.primaryAddress.addressLocality.name",
+            current="Demo City",
+            previous="Old City",
+            timestamp=now
+        )
+        element_column = [
+            [
+                name_element.copy(update={
+                    "current": f"Mock Company {i+1}",
+                    "previous": f"Old Company {i+1}"
+                }),
+                locality_element.copy()
+            ]
+            for i in range(count)
+        ]
+        
+        # Validate the first row so a shape error still surfaces
+        first = Notification(
+            type=NotificationType.UPDATE,
+            organization=Organization(duns=duns_column[0]),
+            elements=element_column[0],
+            deliveryTimeStamp=now
+        )
+        
+        construct = Notification.construct
+        construct_org = Organization.construct
+        notifications = [first]
+        notifications.extend(
+            construct(
+                type=NotificationType.UPDATE,
+                organization=construct_org(duns=duns),
+                elements=elements,
+                delivery_timestamp=now
+            )
+            for duns, elements in zip(duns_column[1:], element_column[1:])
+        )
+        
+        print(f"  ✓ Created {count} mock notifications "
+              f"(DUNS {duns_column[0]}..{duns_column[-1]})")
+        
+        self.demo_notifications_created += count
+        return notifications
+    
     async def demonstrate_multi_storage(self, registration_ref: str):
         """Demonstrate multi-storage notification handling"""
         print("\n=== Demonstrating Multi-Storage Notification Handling ===")
@@ -218,24 +316,50 @@ class MultiStorageDemo:
         
         print(f"\nProcessing {len(notifications)} notifications...")
         
-        # Process notifications through the service
-        # This will automatically trigger all registered handlers (SFTP + Local)
+        # Hand notifications to the writer task, which processes them through
+        # the service and so triggers all registered handlers (SFTP + Local)
         for i, notification in enumerate(notifications, 1):
-            print(f"\n--- Processing Notification {i}/{len(notifications)} ---")
+            print(f"\n--- Queueing Notification {i}/{len(notifications)} ---")
             print(f"DUNS: {notification.duns}")
             print(f"Type: {notification.type.value}")
             print(f"ID: {notification.id}")
             
-            # Process the notification (this triggers storage handlers)
-            success = await self.service.process_notification(notification)
-            
-            if success:
-                print("✓ Notification processed successfully")
-            else:
-                print("✗ Notification processing failed")
+            await self._write_queue.put(notification)
             
-            # Small delay for demonstration
-            await asyncio.sleep(1)
+            # Optional human-readable pacing (DEMO_SLOW=1); off by default so
+            # the demo reflects actual pipeline speed
+            if _DEMO_SLOW:
+                await asyncio.sleep(1)
+        
+        # Wait for the writer so the storage status below reflects every write
+        await self._write_queue.join()
+    
+    async def _writer_loop(self):
+        """Process queued notifications off the producer's path"""
+        process_notification = self.service.process_notification
+        
+        while True:
+            notification = await self._write_queue.get()
+            try:
+                # Process the notification (this triggers storage handlers)
+                success = await process_notification(notification)
+                
+                if success:
+                    print(f"✓ Notification processed successfully: {notification.id}")
+                else:
+                    print(f"✗ Notification processing failed: {notification.id}")
+            finally:
+                self._write_queue.task_done()
+    
+    async def _stop_writer(self):
+        """Drain the write queue and stop the writer task"""
+        if self._writer_task is None:
+            return
+        
+        await self._write_queue.join()
+        self._writer_task.cancel()
+        await asyncio.gather(self._writer_task, return_exceptions=True)
+        self._writer_task = None
     
     def show_storage_status(self):
         """Show the status of all storage backends"""
@@ -278,27 +402,41 @@ class MultiStorageDemo:
         
         try:
             base_path = Path(self.service.config.local_storage.base_path)
-            if not base_path.exists():
+            
+            # Single lazy scandir pass: keep only the first few entries for
+            # display and running totals for the rest, so memory stays constant
+            # however many files the store holds. A missing directory surfaces
+            # as FileNotFoundError.
+            shown_files = []
+            file_count = 0
+            total_bytes = 0
+            try:
+                for entry in _scan_json_files(str(base_path)):
+                    file_count += 1
+                    total_bytes += entry[1]
+                    if file_count <= self.max_listed_files:
+                        shown_files.append(entry)
+            except FileNotFoundError:
                 print(f"Storage directory doesn't exist yet: {base_path}")
                 return
             
             print(f"\nLocal storage directory: {base_path.absolute()}")
             
-            # Walk through the directory structure
-            json_files = list(base_path.rglob("*.json"))
-            if json_files:
-                print(f"Found {len(json_files)} JSON files:")
-                for file_path in json_files:
-                    rel_path = file_path.relative_to(base_path)
-                    file_size = file_path.stat().st_size
-                    print(f"  📄 {rel_path} ({file_size} bytes)")
+            if file_count:
+                if file_count > len(shown_files):
+                    print(f"Found {file_count} JSON files ({total_bytes} bytes), "
+                          f"showing first {len(shown_files)}:")
+                else:
+                    print(f"Found {file_count} JSON files ({total_bytes} bytes):")
+                for rel_path, file_size, file_path in shown_files:
+                    print(f"  📄 {Path(rel_path)} ({file_size} bytes)")
                     
                     # Show content of first few files
-                    if len(json_files) <= 3:
+                    if file_count <= 3:
                         try:
                             with open(file_path, 'r') as f:
                                 data = json.load(f)
-                                print(f"      Sample content: {json.dumps(data, indent=2)[:200]}...")
+                                print(f"      Sample content: {_json_preview(data, 200)}...")
                         except Exception as e:
                             print(f"      Error reading file: {e}")
             else:
@@ -348,6 +486,7 @@ class MultiStorageDemo:
             
         finally:
             # Clean up
+            await self._stop_writer()
             if self.service:
                 await self.service.shutdown()
                 print("\n✓ Service shutdown complete")
@@ -364,9 +503,12 @@ async def main():
         return
     
     # Run the demo
-    demo = MultiStorageDemo(config_path)
+    # DEMO_NO_PREWARM=1 skips pre-warming so first-write latency is visible
+    demo = MultiStorageDemo(config_path, prewarm=os.environ.get("DEMO_NO_PREWARM") != "1")
     await demo.run_demo()
 
 
 if __name__ == "__main__":
+    install_uvloop()
+    
     asyncio.run(main())
@@ -7,11 +7,22 @@ a portfolio of companies for monitoring in the TraceOne system.
 """
 
 import asyncio
-from datetime import datetime
-from typing import List, Dict, Optional
+import functools
+import hashlib
+import logging
+import re
+from datetime import datetime, timezone
+from time import time as _now_ts
+from typing import Callable, KeysView, List, Dict, Optional, Tuple
 import structlog
 
+try:
+    import hyperscan
+except ImportError:  # Optional, the re pattern below is used instead
+    hyperscan = None
+
 from traceone_monitoring import DNBMonitoringService
+from traceone_monitoring.models.notification import Notification
 from traceone_monitoring.models.registration import RegistrationConfig
 from traceone_monitoring.services.monitoring_service import (
     create_standard_monitoring_registration,
@@ -22,15 +33,128 @@ from traceone_monitoring.services.monitoring_service import (
 
 logger = structlog.get_logger(__name__)
 
+# DUNS numbers are fixed-width 9-digit strings
+DUNS_LENGTH = 9
+
+# Number of (name, DUNS) pairs included in portfolio summaries
+SUMMARY_PREVIEW_SIZE = 20
+
+# Element names that indicate a financial change
+_FINANCIAL_KEYWORDS = ("financial", "payment", "rating")
+_FINANCIAL_ELEMENT_RE = re.compile("|".join(_FINANCIAL_KEYWORDS), re.IGNORECASE)
+
+if hyperscan is not None:
+    _FINANCIAL_ELEMENT_DB = hyperscan.Database()
+    _FINANCIAL_ELEMENT_DB.compile(
+        expressions=[keyword.encode() for keyword in _FINANCIAL_KEYWORDS],
+        ids=list(range(len(_FINANCIAL_KEYWORDS))),
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(_FINANCIAL_KEYWORDS)
+    )
+else:
+    _FINANCIAL_ELEMENT_DB = None
+
+
+def _has_financial_element(notification: Notification) -> bool:
+    """Check whether any changed element of a notification is financial"""
+    element_names = "\n".join(e.element for e in notification.elements)
+    
+    if _FINANCIAL_ELEMENT_DB is None:
+        return _FINANCIAL_ELEMENT_RE.search(element_names) is not None
+    
+    matches = []
+    _FINANCIAL_ELEMENT_DB.scan(
+        element_names.encode(),
+        match_event_handler=lambda match_id, start, end, flags, context: matches.append(match_id)
+    )
+    return bool(matches)
+
+
+# Registration factory per monitoring type; unknown types use standard
+_REGISTRATION_FACTORIES = {
+    "standard": create_standard_monitoring_registration,
+    "financial": create_financial_monitoring_registration,
+}
+
+
+def _pack_duns(duns_list: List[str]) -> bytearray:
+    """
+    Pack DUNS numbers into one contiguous fixed-width ASCII buffer
+    
+    Args:
+        duns_list: 9-digit DUNS numbers
+        
+    Returns:
+        Buffer holding DUNS_LENGTH bytes per DUNS
+        
+    Raises:
+        ValueError: If a DUNS is not a 9-digit string
+    """
+    # Checked per entry: with a total-length check alone, a short and a long
+    # DUNS would pass together and be split at the wrong offsets
+    if not all(
+        len(duns) == DUNS_LENGTH and duns.isascii() and duns.isdigit()
+        for duns in duns_list
+    ):
+        raise ValueError("DUNS numbers must be 9-digit strings")
+    return bytearray("".join(duns_list).encode("ascii"))
+
+
+def _unpack_duns(packed: bytearray, limit: Optional[int] = None) -> List[str]:
+    """Decode DUNS numbers from a packed buffer, optionally only the first few"""
+    count = len(packed) // DUNS_LENGTH
+    if limit is not None:
+        count = min(count, limit)
+    text = packed[:count * DUNS_LENGTH].decode("ascii")
+    return [text[i:i + DUNS_LENGTH] for i in range(0, len(text), DUNS_LENGTH)]
+
+
+_SPACE_TABLE = str.maketrans({' ': '_'})
+
+
+@functools.lru_cache(maxsize=1024)
+def _registration_reference(portfolio_name: str) -> str:
+    """Derive the registration reference for a portfolio name"""
+    return f"TraceOne_Portfolio_{portfolio_name.translate(_SPACE_TABLE)}"
+
+
+@functools.lru_cache(maxsize=2)
+def _registration_template(monitoring_type: str) -> Dict:
+    """
+    Build the invariant registration settings for a monitoring type once
+    
+    Only reference, DUNS list and description differ between portfolios,
+    so callers copy this template and fill those in.
+    """
+    config = _REGISTRATION_FACTORIES[monitoring_type](reference="template", duns_list=[])
+    return config.dict(by_alias=True)
+
 
 class PortfolioManager:
     """
     Portfolio manager for organizing and monitoring groups of companies
     """
     
-    def __init__(self, service: DNBMonitoringService):
+    def __init__(
+        self,
+        service: DNBMonitoringService,
+        max_batch: int = 500,
+        max_wait: float = 0.05
+    ):
+        """
+        Initialize portfolio manager
+        
+        Args:
+            service: Monitoring service
+            max_batch: Maximum DUNS coalesced into one add request
+            max_wait: Seconds to wait for further additions before flushing
+        """
         self.service = service
         self.portfolios: Dict[str, Dict] = {}
+        self._summary_cache: Dict[str, Dict] = {}
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._add_queue: Optional[asyncio.Queue] = None
+        self._add_task: Optional[asyncio.Task] = None
     
     async def create_portfolio(
         self,
@@ -60,21 +184,17 @@ class PortfolioManager:
         duns_list = [company['duns'] for company in companies]
         
         # Create registration reference
-        registration_ref = f"TraceOne_Portfolio_{portfolio_name.replace(' ', '_')}"
-        
-        # Create registration configuration
-        if monitoring_type == "financial":
-            config = create_financial_monitoring_registration(
-                reference=registration_ref,
-                duns_list=duns_list,
-                description=description or f"Financial monitoring portfolio: {portfolio_name}"
-            )
-        else:
-            config = create_standard_monitoring_registration(
-                reference=registration_ref,
-                duns_list=duns_list,
-                description=description or f"Standard monitoring portfolio: {portfolio_name}"
-            )
+        registration_ref = _registration_reference(portfolio_name)
+        
+        # Create registration configuration from the cached template
+        kind = monitoring_type if monitoring_type in _REGISTRATION_FACTORIES else "standard"
+        template = dict(_registration_template(kind))
+        template.update(
+            reference=registration_ref,
+            duns_list=duns_list,
+            description=description or f"{kind.title()} monitoring portfolio: {portfolio_name}"
+        )
+        config = RegistrationConfig(**template)
         
         # Create registration
         registration = self.service.create_registration(config)
@@ -83,11 +203,13 @@ class PortfolioManager:
         self.portfolios[portfolio_name] = {
             'registration_reference': registration_ref,
             'registration_id': str(registration.id),
-            'companies': companies,
+            'duns': _pack_duns(duns_list),
+            'names': [company['name'] for company in companies],
             'monitoring_type': monitoring_type,
-            'created_at': datetime.utcnow(),
+            'created_at_ts': _now_ts(),
             'description': description
         }
+        self._summary_cache.pop(portfolio_name, None)
         
         logger.info("Portfolio created successfully",
                    portfolio_name=portfolio_name,
@@ -117,20 +239,88 @@ class PortfolioManager:
         # Extract DUNS numbers
         duns_list = [company['duns'] for company in companies]
         
-        # Add to monitoring
-        await self.service.add_duns_to_monitoring(
-            registration_ref, 
-            duns_list, 
-            batch_mode=True
-        )
+        packed_duns = _pack_duns(duns_list)
+        
+        # Add to monitoring, coalesced with concurrent additions
+        await self._queue_duns_addition(registration_ref, duns_list)
         
         # Update portfolio metadata
-        portfolio['companies'].extend(companies)
+        portfolio['duns'] += packed_duns
+        portfolio['names'].extend(company['name'] for company in companies)
+        self._summary_cache.pop(portfolio_name, None)
         
         logger.info("Companies added to portfolio",
                    portfolio_name=portfolio_name,
                    added_count=len(companies),
-                   total_count=len(portfolio['companies']))
+                   total_count=len(portfolio['duns']) // DUNS_LENGTH)
+    
+    async def _queue_duns_addition(self, registration_ref: str, duns_list: List[str]):
+        """Queue DUNS for the batched add request and wait until it is sent"""
+        if self._add_queue is None:
+            self._add_queue = asyncio.Queue()
+        if self._add_task is None or self._add_task.done():
+            self._add_task = asyncio.create_task(self._drain_duns_additions())
+        
+        future = asyncio.get_running_loop().create_future()
+        await self._add_queue.put((registration_ref, duns_list, future))
+        await future
+    
+    async def _drain_duns_additions(self):
+        """Collect queued additions and issue one add request per registration"""
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            pending = [await self._add_queue.get()]
+            duns_count = len(pending[0][1])
+            deadline = loop.time() + self.max_wait
+            
+            while duns_count < self.max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._add_queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+                pending.append(item)
+                duns_count += len(item[1])
+            
+            # Group by registration so several portfolios can share the batcher
+            groups: Dict[str, List[Tuple[List[str], asyncio.Future]]] = {}
+            for registration_ref, duns_list, future in pending:
+                groups.setdefault(registration_ref, []).append((duns_list, future))
+            
+            for registration_ref, entries in groups.items():
+                merged = [duns for duns_list, _ in entries for duns in duns_list]
+                try:
+                    await self.service.add_duns_to_monitoring(
+                        registration_ref,
+                        merged,
+                        batch_mode=True
+                    )
+                except Exception as e:
+                    for _, future in entries:
+                        if not future.done():
+                            future.set_exception(e)
+                else:
+                    for _, future in entries:
+                        if not future.done():
+                            future.set_result(None)
+                
+                logger.debug("Batched DUNS addition sent",
+                            registration_ref=registration_ref,
+                            requests=len(entries),
+                            duns_count=len(merged))
+    
+    async def close(self):
+        """Stop the background DUNS addition task"""
+        if self._add_task is not None:
+            self._add_task.cancel()
+            try:
+                await self._add_task
+            except asyncio.CancelledError:
+                pass
+            self._add_task = None
     
     async def activate_portfolio_monitoring(self, portfolio_name: str):
         """
@@ -154,48 +344,108 @@ class PortfolioManager:
         else:
             raise RuntimeError(f"Failed to activate monitoring for portfolio '{portfolio_name}'")
     
-    def get_portfolio_summary(self, portfolio_name: str) -> Dict:
+    def get_portfolio_summary(self, portfolio_name: str, verbose: bool = False) -> Dict:
         """
         Get portfolio summary information
         
         Args:
             portfolio_name: Name of the portfolio
+            verbose: Include the full company list (expensive to log)
             
         Returns:
             Portfolio summary
         """
-        if portfolio_name not in self.portfolios:
-            raise ValueError(f"Portfolio '{portfolio_name}' not found")
-        
-        portfolio = self.portfolios[portfolio_name]
-        
-        return {
-            'name': portfolio_name,
-            'registration_reference': portfolio['registration_reference'],
-            'company_count': len(portfolio['companies']),
-            'monitoring_type': portfolio['monitoring_type'],
-            'created_at': portfolio['created_at'],
-            'description': portfolio['description'],
-            'companies': portfolio['companies']
-        }
+        summary = self._summary_cache.get(portfolio_name)
+        if summary is None:
+            if portfolio_name not in self.portfolios:
+                raise ValueError(f"Portfolio '{portfolio_name}' not found")
+            
+            portfolio = self.portfolios[portfolio_name]
+            
+            # Built once per change; the companies are identified by a digest
+            # and a bounded preview rather than listed in full
+            summary = {
+                'name': portfolio_name,
+                'registration_reference': portfolio['registration_reference'],
+                'company_count': len(portfolio['duns']) // DUNS_LENGTH,
+                'companies_digest': hashlib.blake2b(
+                    portfolio['duns'],
+                    digest_size=8
+                ).hexdigest(),
+                'monitoring_type': portfolio['monitoring_type'],
+                'created_at': datetime.fromtimestamp(portfolio['created_at_ts'], tz=timezone.utc),
+                'description': portfolio['description'],
+                'companies_preview': tuple(zip(
+                    portfolio['names'][:SUMMARY_PREVIEW_SIZE],
+                    _unpack_duns(portfolio['duns'], SUMMARY_PREVIEW_SIZE)
+                ))
+            }
+            self._summary_cache[portfolio_name] = summary
+        
+        if verbose:
+            portfolio = self.portfolios[portfolio_name]
+            return {
+                **summary,
+                'companies': [
+                    {'name': name, 'duns': duns}
+                    for name, duns in zip(portfolio['names'], _unpack_duns(portfolio['duns']))
+                ]
+            }
+        
+        # Callers get their own copy of the cached dict
+        return dict(summary)
     
-    def list_portfolios(self) -> List[str]:
+    def list_portfolios(self) -> KeysView[str]:
         """
         List all portfolio names
         
         Returns:
-            List of portfolio names
+            Live view of portfolio names; copy it before creating portfolios
+            while iterating
         """
-        return list(self.portfolios.keys())
+        return self.portfolios.keys()
 
 
-async def create_supplier_portfolio():
+async def _process_all(
+    service: DNBMonitoringService,
+    notifications: List[Notification],
+    concurrency: int = 10,
+    inspect: Optional[Callable[[Notification], None]] = None
+):
+    """
+    Process notifications concurrently with a bounded number in flight
+    
+    Args:
+        service: Monitoring service
+        notifications: Notifications to process
+        concurrency: Maximum notifications processed at once
+        inspect: Optional callback run on each notification before processing
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def _one(notification: Notification):
+        async with semaphore:
+            if inspect:
+                inspect(notification)
+            await service.process_notification(notification)
+    
+    await asyncio.gather(*(_one(notification) for notification in notifications))
+
+
+async def create_supplier_portfolio(service: Optional[DNBMonitoringService] = None):
     """
     Example: Create a supplier monitoring portfolio
+    
+    Args:
+        service: Shared monitoring service; a dedicated one is
+            created and shut down when omitted
     """
+    if service is None:
+        async with DNBMonitoringService.from_config("config/dev.yaml") as service:
+            return await create_supplier_portfolio(service)
+    
     logger.info("Creating supplier portfolio example")
     
-    service = DNBMonitoringService.from_config("config/dev.yaml")
     portfolio_manager = PortfolioManager(service)
     
     try:
@@ -225,16 +475,18 @@ async def create_supplier_portfolio():
         # Start monitoring
         logger.info("Starting supplier portfolio monitoring for 60 seconds...")
         
-        end_time = datetime.now() + timedelta(seconds=60)
-        async for notifications in service.monitor_continuously(registration_ref, polling_interval=15):
-            if datetime.now() > end_time:
-                break
-            
-            if notifications:
-                logger.info("Supplier notifications received",
-                           count=len(notifications))
-                for notification in notifications:
-                    await service.process_notification(notification)
+        async def _consume():
+            async for notifications in service.monitor_continuously(registration_ref, polling_interval=15):
+                if notifications:
+                    logger.info("Supplier notifications received",
+                               count=len(notifications))
+                    await _process_all(service, notifications)
+        
+        # Bound the whole monitoring loop instead of checking the clock per poll
+        try:
+            await asyncio.wait_for(_consume(), timeout=60)
+        except asyncio.TimeoutError:
+            pass
         
         # Get portfolio summary
         summary = portfolio_manager.get_portfolio_summary("Key Suppliers Q4 2024")
@@ -243,17 +495,22 @@ async def create_supplier_portfolio():
     except Exception as e:
         logger.error("Supplier portfolio example failed", error=str(e))
         raise
-    finally:
-        await service.shutdown()
 
 
-async def create_financial_risk_portfolio():
+async def create_financial_risk_portfolio(service: Optional[DNBMonitoringService] = None):
     """
     Example: Create a financial risk monitoring portfolio
+    
+    Args:
+        service: Shared monitoring service; a dedicated one is
+            created and shut down when omitted
     """
+    if service is None:
+        async with DNBMonitoringService.from_config() as service:
+            return await create_financial_risk_portfolio(service)
+    
     logger.info("Creating financial risk portfolio example")
     
-    service = DNBMonitoringService.from_config()
     portfolio_manager = PortfolioManager(service)
     
     try:
@@ -282,32 +539,34 @@ async def create_financial_risk_portfolio():
                    count=len(notifications))
         
         # Process notifications with focus on financial indicators
-        for notification in notifications:
-            if any("financial" in element.element.lower() or 
-                   "payment" in element.element.lower() or
-                   "rating" in element.element.lower()
-                   for element in notification.elements):
+        def _flag_financial_changes(notification):
+            if _has_financial_element(notification):
                 logger.warning("Critical financial change detected",
                               duns=notification.duns,
                               type=notification.type.value,
                               elements=[e.element for e in notification.elements])
-            
-            await service.process_notification(notification)
+        
+        await _process_all(service, notifications, inspect=_flag_financial_changes)
         
     except Exception as e:
         logger.error("Financial risk portfolio example failed", error=str(e))
         raise
-    finally:
-        await service.shutdown()
 
 
-async def create_multi_tier_portfolio():
+async def create_multi_tier_portfolio(service: Optional[DNBMonitoringService] = None):
     """
     Example: Create multiple portfolios for different business segments
+    
+    Args:
+        service: Shared monitoring service; a dedicated one is
+            created and shut down when omitted
     """
+    if service is None:
+        async with DNBMonitoringService.from_config() as service:
+            return await create_multi_tier_portfolio(service)
+    
     logger.info("Creating multi-tier portfolio example")
     
-    service = DNBMonitoringService.from_config()
     portfolio_manager = PortfolioManager(service)
     
     try:
@@ -337,20 +596,28 @@ async def create_multi_tier_portfolio():
             ("Tier 3 Strategic Partners", tier3_partners, "standard")
         ]
         
-        for name, companies, monitoring_type in portfolios:
-            registration_ref = await portfolio_manager.create_portfolio(
-                portfolio_name=name,
-                companies=companies,
-                monitoring_type=monitoring_type,
-                description=f"Multi-tier monitoring: {name}"
-            )
-            
-            await portfolio_manager.activate_portfolio_monitoring(name)
-            
-            logger.info("Portfolio created and activated",
-                       portfolio_name=name,
-                       registration_ref=registration_ref,
-                       company_count=len(companies))
+        # Build the portfolios concurrently, capped to avoid flooding the API
+        semaphore = asyncio.Semaphore(10)
+        
+        async def _build(name: str, companies: List[Dict[str, str]], monitoring_type: str) -> str:
+            async with semaphore:
+                registration_ref = await portfolio_manager.create_portfolio(
+                    portfolio_name=name,
+                    companies=companies,
+                    monitoring_type=monitoring_type,
+                    description=f"Multi-tier monitoring: {name}"
+                )
+                
+                await portfolio_manager.activate_portfolio_monitoring(name)
+                
+                logger.info("Portfolio created and activated",
+                           portfolio_name=name,
+                           registration_ref=registration_ref,
+                           company_count=len(companies))
+                
+                return registration_ref
+        
+        await asyncio.gather(*(_build(*portfolio) for portfolio in portfolios))
         
         # List all portfolios
         all_portfolios = portfolio_manager.list_portfolios()
@@ -364,17 +631,22 @@ async def create_multi_tier_portfolio():
     except Exception as e:
         logger.error("Multi-tier portfolio example failed", error=str(e))
         raise
-    finally:
-        await service.shutdown()
 
 
-async def create_dynamic_portfolio():
+async def create_dynamic_portfolio(service: Optional[DNBMonitoringService] = None):
     """
     Example: Create and dynamically manage a portfolio
+    
+    Args:
+        service: Shared monitoring service; a dedicated one is
+            created and shut down when omitted
     """
+    if service is None:
+        async with DNBMonitoringService.from_config() as service:
+            return await create_dynamic_portfolio(service)
+    
     logger.info("Creating dynamic portfolio example")
     
-    service = DNBMonitoringService.from_config()
     portfolio_manager = PortfolioManager(service)
     
     try:
@@ -403,7 +675,7 @@ async def create_dynamic_portfolio():
             [{"name": "New Company 6", "duns": "666666666"}]
         ]
         
-        for i, batch in enumerate(additional_batches, 1):
+        async def _add_batch(i: int, batch: List[Dict[str, str]]):
             logger.info(f"Adding batch {i} to portfolio", companies=batch)
             
             await portfolio_manager.add_companies_to_portfolio(
@@ -411,14 +683,20 @@ async def create_dynamic_portfolio():
                 batch
             )
             
-            # Show updated summary
             summary = portfolio_manager.get_portfolio_summary("Dynamic Growth Portfolio")
             logger.info("Portfolio updated", 
                        company_count=summary['company_count'],
                        batch=i)
-            
-            # Simulate time delay
-            await asyncio.sleep(2)
+        
+        # All batches are in flight together and coalesce into a single add
+        # request; wait for every batch, then surface the first failure
+        results = await asyncio.gather(
+            *(_add_batch(i, batch) for i, batch in enumerate(additional_batches, 1)),
+            return_exceptions=True
+        )
+        errors = [result for result in results if isinstance(result, Exception)]
+        if errors:
+            raise errors[0]
         
         # Final portfolio summary
         final_summary = portfolio_manager.get_portfolio_summary("Dynamic Growth Portfolio")
@@ -428,29 +706,38 @@ async def create_dynamic_portfolio():
         logger.error("Dynamic portfolio example failed", error=str(e))
         raise
     finally:
-        await service.shutdown()
+        await portfolio_manager.close()
+
+
+async def run_all_examples():
+    """
+    Run every example against one shared monitoring service
+    
+    The examples reuse its pooled HTTP session, and it is shut down once
+    the last one finishes.
+    """
+    async with DNBMonitoringService.from_config() as service:
+        await create_supplier_portfolio(service)
+        await create_financial_risk_portfolio(service)
+        await create_multi_tier_portfolio(service)
+        await create_dynamic_portfolio(service)
 
 
 def main():
     """
     Main function to run portfolio examples
     """
-    # Setup logging
+    # Setup logging; the filtering wrapper turns calls below INFO into no-ops
+    # and ConsoleRenderer formats exceptions itself
     structlog.configure(
         processors=[
-            structlog.stdlib.filter_by_level,
-            structlog.stdlib.add_logger_name,
-            structlog.stdlib.add_log_level,
-            structlog.stdlib.PositionalArgumentsFormatter(),
+            structlog.processors.add_log_level,
             structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            structlog.processors.UnicodeDecoder(),
             structlog.dev.ConsoleRenderer(),
         ],
         context_class=dict,
-        logger_factory=structlog.stdlib.LoggerFactory(),
-        wrapper_class=structlog.stdlib.BoundLogger,
+        logger_factory=structlog.PrintLoggerFactory(),
+        wrapper_class=structlog.make_filtering_bound_logger(logging.INFO),
         cache_logger_on_first_use=True,
     )
     
@@ -469,9 +756,11 @@ def main():
         asyncio.run(create_multi_tier_portfolio())
     elif example_type == "dynamic":
         asyncio.run(create_dynamic_portfolio())
+    elif example_type == "all":
+        asyncio.run(run_all_examples())
     else:
         logger.error("Unknown example type", 
-                    available=["supplier", "financial", "multi", "dynamic"])
+                    available=["supplier", "financial", "multi", "dynamic", "all"])
 
 
 if __name__ == "__main__":
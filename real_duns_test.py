@@ -16,9 +16,13 @@ import sys
 import os
 import asyncio
 import argparse
+import contextlib
+import json
+import logging
+import time
 from pathlib import Path
-from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from datetime import datetime
+from typing import List, Dict, Any, Tuple
 
 # Add the source directory to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
@@ -27,27 +31,84 @@ from dotenv import load_dotenv
 from traceone_monitoring.utils.config import ConfigManager
 from traceone_monitoring.services.monitoring_service import DNBMonitoringService
 from traceone_monitoring.models.registration import RegistrationConfig
-from traceone_monitoring.auth.authenticator import DNBAuthenticator
 from traceone_monitoring.api.client import DNBApiClient
 from traceone_monitoring.api.pull_client import PullApiClient
 import structlog
 
-# Configure logging
+try:
+    import orjson
+except ImportError:  # Optional dependency, falls back to the stdlib encoder
+    orjson = None
+
+
+def _render_log_json(event_dict, **kwargs) -> str:
+    """Serialize a log event with orjson, returning text like json.dumps"""
+    return orjson.dumps(event_dict, default=kwargs.get("default")).decode()
+
+
+# Configure logging; level filtering runs first so disabled events are
+# dropped before any formatting
 structlog.configure(
     processors=[
         structlog.stdlib.filter_by_level,
         structlog.stdlib.add_logger_name,
         structlog.stdlib.add_log_level,
         structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.JSONRenderer()
+        structlog.processors.JSONRenderer(serializer=_render_log_json) if orjson is not None
+        else structlog.processors.JSONRenderer()
     ],
     context_class=dict,
     logger_factory=structlog.stdlib.LoggerFactory(),
+    wrapper_class=structlog.stdlib.BoundLogger,
     cache_logger_on_first_use=True,
 )
 
 logger = structlog.get_logger(__name__)
 
+# Notification records waiting to be written before producers are slowed down
+RECORD_QUEUE_SIZE = 1000
+
+# Notification batches buffered during continuous monitoring before the
+# oldest are dropped, and how many drops pass between warnings
+CONTINUOUS_QUEUE_SIZE = 10
+DROP_LOG_INTERVAL = 100
+
+
+def _encode_record(record: Dict[str, Any]) -> bytes:
+    """Encode one notification record as a JSON Lines entry"""
+    if orjson is not None:
+        return orjson.dumps(record, default=str) + b"\n"
+    return json.dumps(record, default=str).encode() + b"\n"
+
+
+def _scan_storage(base_path: str, max_examples: int = 5) -> Tuple[int, int, List[str]]:
+    """
+    Count files and directories under base_path in one walk
+    
+    Uses os.scandir with an explicit stack so each entry's type comes from
+    the directory listing instead of separate stat() calls.
+    
+    Returns:
+        Tuple of (files found, directories found, first JSON file paths)
+    """
+    files_found = 0
+    directories = 0
+    example_files = []
+    stack = [base_path]
+    
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    directories += 1
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    files_found += 1
+                    if len(example_files) < max_examples and entry.name.endswith(".json"):
+                        example_files.append(entry.path)
+    
+    return files_found, directories, example_files
+
 
 class RealWorldDUNSTest:
     """Real-world DUNS testing with actual D&B API"""
@@ -61,9 +122,15 @@ class RealWorldDUNSTest:
         self.app_config = self.config_manager.load_config()
         self.monitoring_service = None
         
+        # Notification records are streamed here instead of kept in memory
+        started = datetime.utcnow()
+        self.started_at = started
+        self.notifications_file = Path(f"./real_test_notifications_{started:%Y%m%d_%H%M%S}.jsonl")
+        
         # Results tracking
         self.test_results = {
-            "start_time": datetime.utcnow().isoformat(),
+            "start_time": started.isoformat(),
+            "notifications_file": str(self.notifications_file),
             "tests_run": [],
             "errors": [],
             "registrations_created": [],
@@ -112,13 +179,9 @@ class RealWorldDUNSTest:
         logger.info("Testing D&B API authentication...")
         
         try:
-            # Create authenticator directly to test
-            authenticator = DNBAuthenticator(self.app_config.dnb_api)
-            
-            # Try to get a token
-            token = await asyncio.get_event_loop().run_in_executor(
-                None, authenticator.get_token
-            )
+            # Use the service's authenticator so the token stays cached for
+            # the API calls that follow
+            token = await self.monitoring_service.authenticator.get_token_async()
             
             if token:
                 logger.info("Authentication successful", token_length=len(token))
@@ -138,10 +201,12 @@ class RealWorldDUNSTest:
                    duns_count=len(duns_list))
         
         try:
+            created_at = datetime.utcnow().isoformat()
+            
             # Create registration configuration
             config = RegistrationConfig(
                 reference=registration_name,
-                description=f"Real-world test registration created {datetime.utcnow().isoformat()}",
+                description=f"Real-world test registration created {created_at}",
                 duns_list=duns_list,
                 dataBlocks=[
                     "companyinfo_L2_v1",      # Basic company information
@@ -158,13 +223,9 @@ class RealWorldDUNSTest:
                 ]
             )
             
-            # Create registration via monitoring service
-            loop = asyncio.get_event_loop()
-            registration = await loop.run_in_executor(
-                None, 
-                self.monitoring_service.create_registration,
-                config
-            )
+            # Create registration via monitoring service; this is an in-memory
+            # operation, so there is nothing to offload to a thread
+            registration = self.monitoring_service.create_registration(config)
             
             if registration:
                 logger.info("Registration created successfully", 
@@ -175,7 +236,7 @@ class RealWorldDUNSTest:
                     "id": str(registration.id),
                     "reference": registration.reference,
                     "duns_count": len(duns_list),
-                    "created_at": datetime.utcnow().isoformat(),
+                    "created_at": created_at,
                     "duns_list": duns_list
                 })
                 
@@ -206,27 +267,22 @@ class RealWorldDUNSTest:
                 registration_reference, 
                 max_notifications=50
             )
+            pulled_at = datetime.utcnow().isoformat()
             
             logger.info("Notifications pulled successfully", 
                        count=len(notifications),
                        registration=registration_reference)
             
             # Store notification info
-            notification_data = []
-            for notification in notifications:
-                notification_data.append({
-                    "id": str(notification.id),
-                    "type": notification.type.value,
-                    "duns": notification.organization.duns,
-                    "delivery_timestamp": notification.deliveryTimeStamp.isoformat(),
-                    "elements_count": len(notification.elements)
-                })
+            async with self._notification_recorder() as records:
+                for notification in notifications:
+                    await records.put(self._notification_record(registration_reference, notification))
             
             self.test_results["notifications_received"].append({
                 "registration": registration_reference,
                 "count": len(notifications),
-                "timestamp": datetime.utcnow().isoformat(),
-                "notifications": notification_data
+                "timestamp": pulled_at,
+                "file": str(self.notifications_file)
             })
             
             return True
@@ -250,27 +306,83 @@ class RealWorldDUNSTest:
                    duration_minutes=duration_minutes)
         
         try:
-            end_time = datetime.utcnow() + timedelta(minutes=duration_minutes)
+            deadline = time.monotonic() + duration_minutes * 60
             total_notifications = 0
+            dropped_batches = 0
+            dropped_notifications = 0
             
-            async for notification_batch in self.monitoring_service.monitor_continuously(
-                registration_reference
-            ):
-                if datetime.utcnow() > end_time:
-                    break
-                
-                total_notifications += len(notification_batch)
-                logger.info("Received notification batch",
-                           count=len(notification_batch),
-                           total=total_notifications)
-                
-                # Process each notification
-                for notification in notification_batch:
-                    # This would typically trigger your notification handlers
-                    logger.debug("Processing notification",
-                                notification_id=str(notification.id),
-                                duns=notification.organization.duns,
-                                type=notification.type.value)
+            # Batches wait here for processing; when processing falls behind,
+            # the oldest batch is discarded instead of letting memory grow
+            batches: asyncio.Queue = asyncio.Queue(maxsize=CONTINUOUS_QUEUE_SIZE)
+            
+            def offer(item):
+                nonlocal dropped_batches, dropped_notifications
+                try:
+                    batches.put_nowait(item)
+                except asyncio.QueueFull:
+                    oldest = batches.get_nowait()
+                    batches.put_nowait(item)
+                    dropped_batches += 1
+                    dropped_notifications += len(oldest)
+                    if dropped_batches % DROP_LOG_INTERVAL == 1:
+                        logger.warning("Dropping notification batches, processing is falling behind",
+                                      dropped_batches=dropped_batches,
+                                      dropped_notifications=dropped_notifications)
+            
+            async def produce():
+                try:
+                    async for notification_batch in self.monitoring_service.monitor_continuously(
+                        registration_reference
+                    ):
+                        offer(notification_batch)
+                finally:
+                    # Marks the end of the stream
+                    offer(None)
+            
+            producer = asyncio.create_task(produce())
+            try:
+                async with self._notification_recorder() as records:
+                    while True:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        try:
+                            notification_batch = await asyncio.wait_for(batches.get(), timeout=remaining)
+                        except asyncio.TimeoutError:
+                            break
+                        if notification_batch is None:
+                            await producer  # Surfaces a failed stream
+                            break
+                        
+                        total_notifications += len(notification_batch)
+                        logger.info("Received notification batch",
+                                   count=len(notification_batch),
+                                   total=total_notifications)
+                        
+                        # Stream the batch to disk so memory stays flat on long runs
+                        for notification in notification_batch:
+                            await records.put(self._notification_record(registration_reference, notification))
+                        
+                        # Process each notification; skip building the debug
+                        # fields entirely when debug logging is off
+                        if logger.isEnabledFor(logging.DEBUG):
+                            for notification in notification_batch:
+                                # This would typically trigger your notification handlers
+                                logger.debug("Processing notification",
+                                            notification_id=str(notification.id),
+                                            duns=notification.organization.duns,
+                                            type=notification.type.value)
+            finally:
+                producer.cancel()
+                await asyncio.gather(producer, return_exceptions=True)
+            
+            self.test_results["notifications_received"].append({
+                "registration": registration_reference,
+                "count": total_notifications,
+                "dropped": dropped_notifications,
+                "timestamp": datetime.utcnow().isoformat(),
+                "file": str(self.notifications_file)
+            })
             
             logger.info("Continuous monitoring test completed",
                        duration_minutes=duration_minutes,
@@ -290,6 +402,61 @@ class RealWorldDUNSTest:
             })
             return False
     
+    @staticmethod
+    def _notification_record(registration_reference: str, notification) -> Dict[str, Any]:
+        """Summarize a notification as one line of the notifications file"""
+        return {
+            "registration": registration_reference,
+            "id": str(notification.id),
+            "type": notification.type.value,
+            "duns": notification.organization.duns,
+            "delivery_timestamp": notification.delivery_timestamp.isoformat(),
+            "elements_count": len(notification.elements)
+        }
+    
+    @contextlib.asynccontextmanager
+    async def _notification_recorder(self):
+        """
+        Yield a bounded queue whose records are appended to the notifications file
+        
+        A single writer task owns the file, so records from one run are never
+        interleaved, and the bounded queue slows producers down instead of
+        letting records pile up in memory.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=RECORD_QUEUE_SIZE)
+        writer = asyncio.create_task(self._write_records(queue))
+        try:
+            yield queue
+        finally:
+            await queue.put(None)
+            await writer
+    
+    async def _write_records(self, queue: asyncio.Queue):
+        """Drain queued records into the notifications file until a None sentinel"""
+        failed = False
+        with open(self.notifications_file, 'ab') as f:
+            while True:
+                record = await queue.get()
+                if record is None:
+                    break
+                if failed:
+                    # Keep draining so producers never block on a full queue
+                    continue
+                try:
+                    f.write(_encode_record(record))
+                    if queue.empty():
+                        f.flush()
+                except OSError as e:
+                    failed = True
+                    logger.error("Failed to write notification record",
+                                file=str(self.notifications_file),
+                                error=str(e))
+                    self.test_results["errors"].append({
+                        "stage": "notification_recording",
+                        "error": str(e),
+                        "timestamp": datetime.utcnow().isoformat()
+                    })
+    
     def check_storage_results(self):
         """Check where results are stored"""
         logger.info("Checking storage locations...")
@@ -310,18 +477,15 @@ class RealWorldDUNSTest:
         
         # Check local storage
         if self.app_config.local_storage.enabled:
-            local_path = Path(self.app_config.local_storage.base_path)
-            if local_path.exists():
-                files = list(local_path.rglob("*"))
-                storage_info["local_storage"]["files_found"] = len([f for f in files if f.is_file()])
-                storage_info["local_storage"]["directories"] = len([f for f in files if f.is_dir()])
-                
-                # List some example files
-                example_files = []
-                for file_path in local_path.rglob("*.json"):
-                    example_files.append(str(file_path))
-                    if len(example_files) >= 5:  # Limit to first 5
-                        break
+            try:
+                files_found, directories, example_files = _scan_storage(
+                    self.app_config.local_storage.base_path
+                )
+            except FileNotFoundError:
+                pass
+            else:
+                storage_info["local_storage"]["files_found"] = files_found
+                storage_info["local_storage"]["directories"] = directories
                 storage_info["local_storage"]["example_files"] = example_files
         
         self.test_results["storage_info"] = storage_info
@@ -331,17 +495,21 @@ class RealWorldDUNSTest:
     
     def save_test_results(self):
         """Save test results to file"""
-        self.test_results["end_time"] = datetime.utcnow().isoformat()
-        self.test_results["duration_seconds"] = (
-            datetime.fromisoformat(self.test_results["end_time"].replace('Z', '')) - 
-            datetime.fromisoformat(self.test_results["start_time"].replace('Z', ''))
-        ).total_seconds()
+        # Work from the datetime objects rather than re-parsing the ISO strings
+        ended = datetime.utcnow()
+        self.test_results["end_time"] = ended.isoformat()
+        self.test_results["duration_seconds"] = (ended - self.started_at).total_seconds()
         
         # Save to JSON file
-        import json
         results_file = Path("./real_test_results.json")
-        with open(results_file, 'w') as f:
-            json.dump(self.test_results, f, indent=2, default=str)
+        if orjson is not None:
+            results_file.write_bytes(orjson.dumps(
+                self.test_results,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                default=str
+            ))
+        else:
+            results_file.write_text(json.dumps(self.test_results, indent=2, default=str))
         
         logger.info("Test results saved", file=str(results_file))
         return results_file
@@ -436,6 +604,7 @@ async def main():
         print("\n6️⃣ Saving test results...")
         results_file = test.save_test_results()
         print(f"✅ Results saved to: {results_file}")
+        print(f"✅ Notification records: {test.notifications_file}")
         
         print("\n🎉 Real-world testing completed successfully!")
         print("\n📋 Next Steps:")
@@ -7,18 +7,35 @@ Supports various CSV formats and provides validation.
 """
 
 import csv
+import mmap
+import os
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Iterator, List, Dict, Any, Optional, Sequence, Set, Tuple
 import click
 import structlog
 
+try:
+    import pandas as pd
+except ImportError:  # Optional, only used for bulk loads
+    pd = None
+
 logger = structlog.get_logger(__name__)
 
 
 class DunsCSVLoader:
     """Utility class for loading DUNS numbers from CSV files"""
     
+    _NON_DIGIT = re.compile(r'\D+')
+    # Values in simple CSVs, separated by commas, semicolons, tabs or newlines
+    _SIMPLE_VALUE = re.compile(rb'[^,;\t\r\n]+')
+    # Delimiters implied by the file extension, no sniffing needed
+    _EXTENSION_DELIMITERS = {'.tsv': '\t', '.psv': '|'}
+    # Delimiter of the last file read, tried first for the next one
+    _last_delimiter: Optional[str] = None
+    
     def __init__(self):
         self.valid_duns = []
         self.invalid_duns = []
@@ -34,11 +51,12 @@ class DunsCSVLoader:
         Returns:
             True if valid DUNS format
         """
-        # Remove any non-digit characters
-        clean_duns = ''.join(c for c in str(duns) if c.isdigit())
-        
-        # DUNS should be 9 digits
-        return len(clean_duns) == 9 and clean_duns.isdigit()
+        duns = str(duns)
+        # Already clean values, the common case, skip the substitution
+        if len(duns) == 9 and duns.isascii() and duns.isdigit():
+            return True
+        # Remove any non-digit characters; DUNS should be 9 digits
+        return len(self._NON_DIGIT.sub('', duns)) == 9
     
     def clean_duns(self, duns: str) -> str:
         """
@@ -50,15 +68,18 @@ class DunsCSVLoader:
         Returns:
             Cleaned DUNS number
         """
-        # Remove any non-digit characters and leading zeros
-        clean = ''.join(c for c in str(duns) if c.isdigit())
-        return clean.zfill(9)  # Pad to 9 digits
+        duns = str(duns)
+        if len(duns) == 9 and duns.isascii() and duns.isdigit():
+            return duns
+        # Remove any non-digit characters and pad to 9 digits
+        return self._NON_DIGIT.sub('', duns).zfill(9)
     
     def load_from_csv(
         self, 
         csv_file: str, 
         duns_column: str = "duns",
-        has_header: bool = True
+        has_header: bool = True,
+        seen: Optional[Set[int]] = None
     ) -> List[str]:
         """
         Load DUNS numbers from CSV file
@@ -67,16 +88,44 @@ class DunsCSVLoader:
             csv_file: Path to CSV file
             duns_column: Name or index of DUNS column
             has_header: Whether CSV has header row
+            seen: DUNS already loaded, as integers; shared to de-duplicate across files
             
         Returns:
             List of valid DUNS numbers
         """
+        duns_list = list(self.iter_from_csv(csv_file, duns_column, has_header, seen))
+        self.valid_duns = duns_list
+        return duns_list
+    
+    def iter_from_csv(
+        self, 
+        csv_file: str, 
+        duns_column: str = "duns",
+        has_header: bool = True,
+        seen: Optional[Set[int]] = None
+    ) -> Iterator[str]:
+        """
+        Stream valid, de-duplicated DUNS numbers from CSV file as rows are read
+        
+        Args:
+            csv_file: Path to CSV file
+            duns_column: Name or index of DUNS column
+            has_header: Whether CSV has header row
+            seen: DUNS already loaded, as integers; shared to de-duplicate across files
+            
+        Yields:
+            Valid DUNS numbers in file order
+        """
         csv_path = Path(csv_file)
         
         if not csv_path.exists():
             raise FileNotFoundError(f"CSV file not found: {csv_file}")
         
-        duns_list = []
+        # DUNS are tracked as integers, which hash faster and take less
+        # memory than the 9-character strings
+        if seen is None:
+            seen = set()
+        valid_count = 0
         invalid_count = 0
         
         try:
@@ -84,36 +133,43 @@ class DunsCSVLoader:
                 # Try to detect delimiter
                 sample = file.read(1024)
                 file.seek(0)
-                sniffer = csv.Sniffer()
-                delimiter = sniffer.sniff(sample).delimiter
+                delimiter = self._detect_delimiter(csv_path, sample)
+                
+                reader = csv.reader(file, delimiter=delimiter)
                 
-                reader = csv.DictReader(file, delimiter=delimiter) if has_header else csv.reader(file, delimiter=delimiter)
+                # Resolve the DUNS column once instead of per row
+                if has_header:
+                    header = next(reader, [])
+                    col_index = next(
+                        (header.index(name)
+                         for name in [duns_column, 'DUNS', 'duns_number', 'duns_num', 'company_duns']
+                         if name in header),
+                        None
+                    )
+                    if col_index is None:
+                        logger.warning("DUNS column not found", file=csv_file, column=duns_column)
+                else:
+                    col_index = int(duns_column) if duns_column.isdigit() else 0
                 
-                for row_num, row in enumerate(reader, 1):
+                for row_num, row in enumerate(reader if col_index is not None else (), 1):
                     try:
-                        if has_header:
-                            # Use column name
-                            duns_value = row.get(duns_column)
-                            if duns_value is None:
-                                # Try common column name variations
-                                for col_variant in ['DUNS', 'duns_number', 'duns_num', 'company_duns']:
-                                    if col_variant in row:
-                                        duns_value = row[col_variant]
-                                        break
-                        else:
-                            # Use column index
-                            col_index = int(duns_column) if duns_column.isdigit() else 0
-                            duns_value = row[col_index]
+                        if has_header and col_index >= len(row):
+                            # Short row, as DictReader would have filled with None
+                            continue
+                        duns_value = row[col_index]
                         
                         if duns_value and str(duns_value).strip():
                             duns_clean = self.clean_duns(duns_value)
                             
                             if self.is_valid_duns(duns_clean):
-                                if duns_clean not in duns_list:  # Avoid duplicates
-                                    duns_list.append(duns_clean)
+                                duns_key = int(duns_clean)
+                                if duns_key not in seen:  # Avoid duplicates
+                                    seen.add(duns_key)
+                                    valid_count += 1
                                     logger.debug("Valid DUNS loaded", 
                                                duns=duns_clean, 
                                                row=row_num)
+                                    yield duns_clean
                             else:
                                 invalid_count += 1
                                 self.invalid_duns.append({
@@ -139,19 +195,173 @@ class DunsCSVLoader:
         
         logger.info("CSV loading completed",
                    file=csv_file,
-                   valid_duns=len(duns_list),
+                   valid_duns=valid_count,
                    invalid_duns=invalid_count,
-                   total_processed=len(duns_list) + invalid_count)
+                   total_processed=valid_count + invalid_count)
+    
+    def _detect_delimiter(self, csv_path: Path, sample: str) -> str:
+        """
+        Pick the delimiter for a CSV file
+        
+        The extension decides for .tsv/.psv files. Otherwise the delimiter of
+        the previous file is reused when it splits the first line into several
+        fields, and only then is the sample sniffed.
+        
+        Args:
+            csv_path: Path to CSV file
+            sample: Start of the file content
+            
+        Returns:
+            Field delimiter
+        """
+        delimiter = self._EXTENSION_DELIMITERS.get(csv_path.suffix.lower())
+        if delimiter:
+            return delimiter
+        
+        cached = DunsCSVLoader._last_delimiter
+        first_line = sample.partition('\n')[0]
+        if cached and len(next(csv.reader([first_line], delimiter=cached), [])) > 1:
+            return cached
+        
+        try:
+            delimiter = csv.Sniffer().sniff(sample).delimiter
+        except csv.Error:
+            # Single column files give the sniffer nothing to detect
+            return ','
+        
+        DunsCSVLoader._last_delimiter = delimiter
+        return delimiter
+    
+    def load_many(
+        self,
+        csv_files: Sequence[str],
+        duns_column: str = "duns",
+        has_header: bool = True,
+        max_workers: Optional[int] = None
+    ) -> List[str]:
+        """
+        Load DUNS numbers from several CSV files in parallel
+        
+        Each file is parsed and validated in its own worker process, since
+        validation is CPU-bound, and the results are merged in file order
+        with duplicates across files dropped.
+        
+        Args:
+            csv_files: Paths to CSV files
+            duns_column: Name or index of DUNS column
+            has_header: Whether the CSVs have a header row
+            max_workers: Worker processes (defaults to the CPU count)
+            
+        Returns:
+            List of valid DUNS numbers
+        """
+        if len(csv_files) <= 1:
+            return self.load_from_csv(csv_files[0], duns_column, has_header) if csv_files else []
+        
+        workers = min(max_workers or os.cpu_count() or 1, len(csv_files))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(
+                _load_one_file,
+                csv_files,
+                [duns_column] * len(csv_files),
+                [has_header] * len(csv_files)
+            ))
+        
+        seen = set()
+        duns_list = []
+        for csv_file, (file_duns, file_invalid) in zip(csv_files, results):
+            for duns in file_duns:
+                duns_key = int(duns)
+                if duns_key not in seen:
+                    seen.add(duns_key)
+                    duns_list.append(duns)
+            self.invalid_duns.extend({'file': csv_file, **invalid} for invalid in file_invalid)
+        
+        self.valid_duns = duns_list
+        
+        logger.info("CSV files loaded",
+                   files=len(csv_files),
+                   workers=workers,
+                   valid_duns=len(duns_list),
+                   invalid_duns=len(self.invalid_duns))
+        
+        return duns_list
+    
+    def load_from_csv_pandas(self, csv_file: str, duns_column: str = "duns") -> List[str]:
+        """
+        Load DUNS numbers from a large CSV file with vectorized cleaning
+        
+        Falls back to load_from_csv when pandas is not installed.
+        
+        Args:
+            csv_file: Path to CSV file with a header row
+            duns_column: Name of DUNS column
+            
+        Returns:
+            List of valid DUNS numbers
+        """
+        if pd is None:
+            return self.load_from_csv(csv_file, duns_column)
+        
+        csv_path = Path(csv_file)
+        
+        if not csv_path.exists():
+            raise FileNotFoundError(f"CSV file not found: {csv_file}")
+        
+        with open(csv_path, 'r', newline='', encoding='utf-8') as file:
+            sample = file.read(1024)
+        delimiter = self._detect_delimiter(csv_path, sample)
+        
+        # Resolve the DUNS column, trying common name variations
+        header = pd.read_csv(csv_path, sep=delimiter, nrows=0).columns
+        column = next(
+            (name for name in [duns_column, 'DUNS', 'duns_number', 'duns_num', 'company_duns']
+             if name in header),
+            None
+        )
+        if column is None:
+            logger.warning("DUNS column not found", file=csv_file, column=duns_column)
+            self.valid_duns = []
+            return []
+        
+        values = pd.read_csv(
+            csv_path,
+            usecols=[column],
+            dtype=str,
+            sep=delimiter,
+            engine='c'
+        )[column]
+        
+        values = values[values.notna() & (values.str.strip() != '')]
+        cleaned = values.str.replace(r'\D', '', regex=True).str.zfill(9)
+        valid = cleaned.str.len() == 9
+        
+        # Row numbers start at 1 for the first data row, as in load_from_csv
+        for index in cleaned.index[~valid]:
+            self.invalid_duns.append({
+                'row': index + 1,
+                'original': values[index],
+                'cleaned': cleaned[index]
+            })
+        
+        duns_list = cleaned[valid].unique().tolist()
+        
+        logger.info("CSV loading completed",
+                   file=csv_file,
+                   valid_duns=len(duns_list),
+                   invalid_duns=int((~valid).sum()),
+                   total_processed=len(cleaned))
         
         self.valid_duns = duns_list
         return duns_list
     
-    def load_from_simple_csv(self, csv_file: str) -> List[str]:
+    def load_from_simple_csv(self, csv_file: str, seen: Optional[Set[int]] = None) -> List[str]:
         """
         Load DUNS from simple CSV (one DUNS per line or comma-separated)
         
         Args:
             csv_file: Path to simple CSV file
+            seen: DUNS already loaded, as integers; shared to de-duplicate across files
             
         Returns:
             List of valid DUNS numbers
@@ -162,25 +372,23 @@ class DunsCSVLoader:
             raise FileNotFoundError(f"CSV file not found: {csv_file}")
         
         duns_list = []
+        if seen is None:
+            seen = set()
         
-        with open(csv_path, 'r') as file:
-            content = file.read().strip()
-            
-            # Try different separators
-            for separator in [',', '\n', ';', '\t']:
-                if separator in content:
-                    values = content.split(separator)
-                    break
-            else:
-                # Single value
-                values = [content]
-            
-            for value in values:
-                value = value.strip()
-                if value:
-                    duns_clean = self.clean_duns(value)
-                    if self.is_valid_duns(duns_clean) and duns_clean not in duns_list:
-                        duns_list.append(duns_clean)
+        # Scan the memory-mapped file for values instead of reading and
+        # splitting it as one string
+        with open(csv_path, 'rb') as file:
+            if csv_path.stat().st_size:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                    for match in self._SIMPLE_VALUE.finditer(content):
+                        value = match.group().strip()
+                        if value:
+                            duns_clean = self.clean_duns(value.decode('utf-8', 'ignore'))
+                            if self.is_valid_duns(duns_clean):
+                                duns_key = int(duns_clean)
+                                if duns_key not in seen:
+                                    seen.add(duns_key)
+                                    duns_list.append(duns_clean)
         
         logger.info("Simple CSV loading completed",
                    file=csv_file,
@@ -196,17 +404,22 @@ class DunsCSVLoader:
             duns_list: List of DUNS numbers
             output_file: Output CSV file path
         """
-        with open(output_file, 'w', newline='') as file:
+        with open(output_file, 'w', newline='', buffering=1 << 20) as file:
             writer = csv.writer(file)
             writer.writerow(['duns'])  # Header
-            for duns in duns_list:
-                writer.writerow([duns])
+            writer.writerows((duns,) for duns in duns_list)
         
         logger.info("DUNS exported to CSV", 
                    file=output_file, 
                    count=len(duns_list))
 
 
+def _load_one_file(csv_file: str, duns_column: str, has_header: bool) -> Tuple[List[str], List[Dict[str, Any]]]:
+    """Load one CSV file in a worker process, returning its valid and invalid DUNS"""
+    loader = DunsCSVLoader()
+    return loader.load_from_csv(csv_file, duns_column, has_header), loader.invalid_duns
+
+
 @click.group()
 def cli():
     """DUNS CSV Loader Utility"""
@@ -214,12 +427,12 @@ def cli():
 
 
 @cli.command()
-@click.argument('csv_file')
+@click.argument('csv_files', nargs=-1, required=True)
 @click.option('--column', '-c', default='duns', help='DUNS column name or index')
 @click.option('--no-header', is_flag=True, help='CSV has no header row')
 @click.option('--output', '-o', help='Save valid DUNS to file')
-def load(csv_file, column, no_header, output):
-    """Load and validate DUNS from CSV file"""
+def load(csv_files, column, no_header, output):
+    """Load and validate DUNS from one or more CSV files"""
     
     # Setup logging
     structlog.configure(
@@ -239,11 +452,12 @@ def load(csv_file, column, no_header, output):
     loader = DunsCSVLoader()
     
     try:
-        duns_list = loader.load_from_csv(
-            csv_file, 
-            column, 
-            has_header=not no_header
-        )
+        if len(csv_files) > 1:
+            duns_list = loader.load_many(csv_files, column, has_header=not no_header)
+        elif no_header:
+            duns_list = loader.load_from_csv(csv_files[0], column, has_header=False)
+        else:
+            duns_list = loader.load_from_csv_pandas(csv_files[0], column)
         
         click.echo(f"✅ Successfully loaded {len(duns_list)} valid DUNS numbers:")
         
@@ -253,7 +467,8 @@ def load(csv_file, column, no_header, output):
         if loader.invalid_duns:
             click.echo(f"\n⚠️  Found {len(loader.invalid_duns)} invalid DUNS:")
             for invalid in loader.invalid_duns[:5]:  # Show first 5
-                click.echo(f"  Row {invalid['row']}: {invalid['original']} -> {invalid['cleaned']}")
+                location = f"{invalid['file']} row {invalid['row']}" if 'file' in invalid else f"Row {invalid['row']}"
+                click.echo(f"  {location}: {invalid['original']} -> {invalid['cleaned']}")
             
             if len(loader.invalid_duns) > 5:
                 click.echo(f"  ... and {len(loader.invalid_duns) - 5} more")
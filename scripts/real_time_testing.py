@@ -7,40 +7,73 @@ It includes various testing scenarios for real-time monitoring capabilities.
 """
 
 import asyncio
+import contextlib
+import itertools
+import logging
 import os
+import re
 import sys
-from datetime import datetime, timedelta
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import List, Dict, Optional
 import structlog
-import click
 
-# Add the src directory to Python path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+try:
+    import orjson
+except ImportError:  # Optional dependency, falls back to the stdlib encoder
+    orjson = None
+
+# Use the installed package (pip install -e .) when there is one, and only
+# fall back to adding the checkout's src directory to the path
+try:
+    import traceone_monitoring  # noqa: F401
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from traceone_monitoring import DNBMonitoringService
-from traceone_monitoring.models.registration import RegistrationConfig
+from traceone_monitoring.models.registration import Registration, RegistrationConfig
+from traceone_monitoring.models.notification import Notification
 from traceone_monitoring.services.monitoring_service import (
     create_standard_monitoring_registration,
     create_financial_monitoring_registration,
     log_notification_handler
 )
 from traceone_monitoring.utils.config import init_config
+from traceone_monitoring.utils.event_loop import install_uvloop
 
 
 logger = structlog.get_logger(__name__)
 
+# Polled notification batches allowed to wait for processing
+POLL_QUEUE_SIZE = 4
+
+_DUNS_RE = re.compile(r'[0-9]{9}')
+
+
+@dataclass
+class ActiveRegistration:
+    """Registration created by the test runner, tracked until cleanup"""
+    __slots__ = ('registration', 'registration_id', 'created_at', 'duns_list', 'type')
+    
+    registration: Registration
+    registration_id: str
+    created_at: datetime
+    duns_list: List[str]
+    type: str
+
 
 class RealTimeTestRunner:
     """
     Real-time test runner for TraceOne monitoring service
     """
+    __slots__ = ('config_path', 'service', 'active_registrations')
     
     def __init__(self, config_path: str = "config/dev.yaml"):
         """Initialize the test runner with configuration"""
         self.config_path = config_path
         self.service = None
-        self.active_registrations = {}
+        self.active_registrations: Dict[str, ActiveRegistration] = {}
     
     async def setup(self):
         """Setup the monitoring service"""
@@ -118,16 +151,18 @@ class RealTimeTestRunner:
             registration = self.service.create_registration(config)
             
             # Store for tracking
-            self.active_registrations[reference] = {
-                'registration': registration,
-                'created_at': datetime.utcnow(),
-                'duns_list': duns_list,
-                'type': monitoring_type
-            }
+            active = ActiveRegistration(
+                registration=registration,
+                registration_id=str(registration.id),
+                created_at=datetime.now(timezone.utc),
+                duns_list=list(duns_list),
+                type=monitoring_type
+            )
+            self.active_registrations[reference] = active
             
             logger.info("✅ Test registration created",
                        reference=reference,
-                       registration_id=str(registration.id),
+                       registration_id=active.registration_id,
                        status=registration.status.value)
             
             return reference
@@ -136,18 +171,117 @@ class RealTimeTestRunner:
             logger.error("❌ Failed to create test registration", error=str(e))
             raise
     
+    async def stream_duns_from_csv(
+        self,
+        registration_ref: str,
+        csv_file: str,
+        duns_column: str = "duns",
+        max_duns: Optional[int] = None,
+        batch_size: int = 100,
+        consumers: int = 4
+    ) -> int:
+        """
+        Add DUNS from a CSV file to a registration while the file is being read
+        
+        A producer thread parses the CSV into batches on a bounded queue and
+        consumer tasks send each batch as one add request, so file reading,
+        validation and API round-trips overlap. The bounded queue keeps a
+        fast reader from running ahead of the API.
+        
+        Args:
+            registration_ref: Registration to add the DUNS to
+            csv_file: CSV file containing DUNS numbers
+            duns_column: Column name for DUNS in CSV file
+            max_duns: Maximum DUNS to take from the file
+            batch_size: DUNS per add request
+            consumers: Concurrent add requests
+            
+        Returns:
+            Number of DUNS added
+        """
+        from duns_csv_loader import DunsCSVLoader
+        
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=consumers * 2)
+        tracked_duns = self.active_registrations[registration_ref].duns_list
+        # DUNS already in the registration are skipped in the file
+        seen = {int(duns) for duns in tracked_duns}
+        errors = []
+        added = 0
+        
+        def put(item):
+            asyncio.run_coroutine_threadsafe(queue.put(item), loop).result()
+        
+        def produce():
+            loader = DunsCSVLoader()
+            batch = []
+            try:
+                # Rows past max_duns are never parsed, and closing the
+                # generator releases the file as soon as the cap is reached
+                with contextlib.closing(loader.iter_from_csv(csv_file, duns_column, seen=seen)) as csv_duns:
+                    for duns in itertools.islice(csv_duns, max_duns):
+                        batch.append(duns)
+                        if len(batch) >= batch_size:
+                            put(batch)
+                            batch = []
+                if batch:
+                    put(batch)
+            finally:
+                for _ in range(consumers):
+                    put(None)
+        
+        async def consume():
+            nonlocal added
+            while True:
+                batch = await queue.get()
+                if batch is None:
+                    return
+                if errors:
+                    # Keep draining so the producer never blocks on a full queue
+                    continue
+                try:
+                    await self.service.add_duns_to_monitoring(registration_ref, batch, batch_mode=True)
+                    tracked_duns.extend(batch)
+                    added += len(batch)
+                except Exception as e:
+                    errors.append(e)
+        
+        results = await asyncio.gather(
+            asyncio.to_thread(produce),
+            *(consume() for _ in range(consumers)),
+            return_exceptions=True
+        )
+        
+        if isinstance(results[0], Exception):
+            raise results[0]
+        if errors:
+            raise errors[0]
+        
+        logger.info("✅ DUNS streamed from CSV",
+                   registration=registration_ref,
+                   file=csv_file,
+                   added=added)
+        
+        return added
+    
     async def activate_and_monitor(
         self,
         registration_ref: str,
         duration_minutes: int = 5,
-        polling_interval: int = 30
+        polling_interval: int = 30,
+        concurrency: int = 10
     ):
-        """Activate monitoring and run for specified duration"""
+        """
+        Activate monitoring and run for specified duration
         
-        logger.info("🚀 Activating real-time monitoring",
-                   registration=registration_ref,
-                   duration_minutes=duration_minutes,
-                   polling_interval=polling_interval)
+        Notifications in a polled batch are handled concurrently, at most
+        `concurrency` at a time so rate-limited handlers are not flooded.
+        """
+        # Bind the fields every event of this session carries once
+        log = logger.bind(registration=registration_ref, polling_interval=polling_interval)
+        
+        log.info("🚀 Activating real-time monitoring",
+                duration_minutes=duration_minutes)
         
         try:
             # Activate monitoring
@@ -156,68 +290,154 @@ class RealTimeTestRunner:
             if not success:
                 raise RuntimeError(f"Failed to activate monitoring for {registration_ref}")
             
-            logger.info("✅ Monitoring activated successfully")
+            log.info("✅ Monitoring activated successfully")
             
-            # Start monitoring for specified duration
-            end_time = datetime.now() + timedelta(minutes=duration_minutes)
+            # Start monitoring for specified duration; the deadline runs on
+            # the loop's monotonic clock, wall-clock time is only for logs
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + duration_minutes * 60
             notification_count = 0
+            semaphore = asyncio.Semaphore(concurrency)
             
-            logger.info("📡 Starting real-time monitoring session",
-                       end_time=end_time.strftime("%H:%M:%S"))
+            log.info("📡 Starting real-time monitoring session",
+                    end_time=(datetime.now() + timedelta(minutes=duration_minutes)).strftime("%H:%M:%S"))
             
-            async for notifications in self.service.monitor_continuously(
-                registration_ref, 
-                polling_interval=polling_interval,
-                max_notifications=50
-            ):
-                # Check if we should stop
-                if datetime.now() > end_time:
-                    logger.info("⏰ Monitoring session completed")
-                    break
-                
+            async def handle_batch(notifications):
+                nonlocal notification_count
                 if notifications:
                     notification_count += len(notifications)
-                    logger.info("📬 Notifications received",
-                               count=len(notifications),
-                               total=notification_count)
+                    log.info("📬 Notifications received",
+                            count=len(notifications),
+                            total=notification_count)
+                    
+                    # Process the notifications of this batch together
+                    await asyncio.gather(*(
+                        self._handle_notification(notification, semaphore)
+                        for notification in notifications
+                    ))
+                elif log.is_enabled_for(logging.INFO):
+                    log.info("🔍 Polling completed - No new notifications",
+                            time=datetime.now().strftime("%H:%M:%S"))
+            
+            # Polling runs in its own task so the next pull overlaps the
+            # handling of the previous batch; the bounded queue keeps it at
+            # most POLL_QUEUE_SIZE batches ahead
+            batches: asyncio.Queue = asyncio.Queue(maxsize=POLL_QUEUE_SIZE)
+            producer = asyncio.create_task(self._poll_batches(registration_ref, polling_interval, batches))
+            
+            try:
+                while True:
+                    # Check if we should stop
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        log.info("⏰ Monitoring session completed")
+                        break
+                    try:
+                        notifications = await asyncio.wait_for(batches.get(), timeout=remaining)
+                    except asyncio.TimeoutError:
+                        log.info("⏰ Monitoring session completed")
+                        break
+                    if notifications is None:
+                        await producer  # Surfaces a failed poll
+                        break
                     
-                    # Process each notification
-                    for notification in notifications:
-                        await self.process_test_notification(notification)
-                        await self.service.process_notification(notification)
-                else:
-                    logger.info("🔍 Polling completed - No new notifications",
-                               time=datetime.now().strftime("%H:%M:%S"))
+                    await handle_batch(notifications)
+            finally:
+                producer.cancel()
+                results = await asyncio.gather(producer, return_exceptions=True)
+            
+            # A pull removes its notifications from the D&B feed, so batches
+            # already read ahead are still handled rather than dropped: first
+            # the queued ones, then one the producer was still handing over
+            leftovers = []
+            while not batches.empty():
+                leftovers.append(batches.get_nowait())
+            if isinstance(results[0], list):
+                leftovers.append(results[0])
+            for notifications in leftovers:
+                if notifications is not None:
+                    await handle_batch(notifications)
             
             return notification_count
             
         except Exception as e:
-            logger.error("❌ Monitoring session failed", error=str(e))
+            log.error("❌ Monitoring session failed", error=str(e))
+            raise
+    
+    async def _poll_batches(
+        self,
+        registration_ref: str,
+        polling_interval: int,
+        batches: asyncio.Queue
+    ) -> Optional[List[Notification]]:
+        """
+        Feed polled notification batches into a queue, ending with None
+        
+        When cancelled while waiting for room in the queue, the batch in
+        hand is returned instead of being lost.
+        """
+        try:
+            async for notifications in self.service.monitor_continuously(
+                registration_ref, 
+                polling_interval=polling_interval,
+                max_notifications=50
+            ):
+                try:
+                    await batches.put(notifications)
+                except asyncio.CancelledError:
+                    return notifications
+        except Exception:
+            # Wake the consumer so it can pick up the error from this task
+            await batches.put(None)
             raise
+        await batches.put(None)
+    
+    async def _handle_notification(self, notification, semaphore: asyncio.Semaphore):
+        """Log a notification and run it through the service handlers"""
+        async with semaphore:
+            await self.process_test_notification(notification)
+            await self.service.process_notification(notification)
     
     async def process_test_notification(self, notification):
         """Process a notification for testing purposes"""
         
+        # Everything below is INFO logging; skip building the event fields
+        # when it is filtered out anyway
+        if not logger.is_enabled_for(logging.INFO):
+            return
+        
+        # One event per notification with all element changes, so the
+        # processor chain runs once instead of once per element
+        elements = notification.elements
         logger.info("🔔 Processing notification",
                    duns=notification.duns,
                    type=notification.type.value,
-                   elements_count=len(notification.elements),
-                   delivery_time=notification.delivery_timestamp)
+                   elements_count=len(elements),
+                   delivery_time=notification.delivery_timestamp,
+                   elements=[
+                       {
+                           "element": element.element,
+                           "previous_value": element.previous_value,
+                           "new_value": element.new_value,
+                           "change_type": element.change_indicator
+                       }
+                       for element in elements
+                   ])
         
-        # Log details of what changed
-        for element in notification.elements:
-            logger.info("📊 Data element change",
-                       element=element.element,
-                       previous_value=element.previous_value,
-                       new_value=element.new_value,
-                       change_type=element.change_indicator)
+        # Per-element detail stays available at debug level
+        if logger.is_enabled_for(logging.DEBUG):
+            for element in elements:
+                logger.debug("📊 Data element change",
+                            element=element.element,
+                            previous_value=element.previous_value,
+                            new_value=element.new_value,
+                            change_type=element.change_indicator)
     
     async def test_pull_notifications(self, registration_ref: str, max_notifications: int = 20):
         """Test pulling notifications on-demand"""
+        log = logger.bind(registration=registration_ref, max_notifications=max_notifications)
         
-        logger.info("📥 Testing notification pull",
-                   registration=registration_ref,
-                   max_notifications=max_notifications)
+        log.info("📥 Testing notification pull")
         
         try:
             notifications = await self.service.pull_notifications(
@@ -225,55 +445,57 @@ class RealTimeTestRunner:
                 max_notifications
             )
             
-            logger.info("✅ Notifications pulled successfully",
-                       count=len(notifications))
+            log.info("✅ Notifications pulled successfully",
+                    count=len(notifications))
             
             if notifications:
                 for i, notification in enumerate(notifications, 1):
-                    logger.info(f"📋 Notification {i}",
-                               duns=notification.duns,
-                               type=notification.type.value,
-                               elements=len(notification.elements),
-                               timestamp=notification.delivery_timestamp)
-                    
-                    # Process each notification
-                    await self.process_test_notification(notification)
+                    log.info(f"📋 Notification {i}",
+                            duns=notification.duns,
+                            type=notification.type.value,
+                            elements=len(notification.elements),
+                            timestamp=notification.delivery_timestamp)
+                
+                # Process the notifications together
+                await asyncio.gather(*map(self.process_test_notification, notifications))
             else:
-                logger.info("ℹ️  No notifications available at this time")
+                log.info("ℹ️  No notifications available at this time")
             
             return notifications
             
         except Exception as e:
-            logger.error("❌ Failed to pull notifications", error=str(e))
+            log.error("❌ Failed to pull notifications", error=str(e))
             raise
     
     async def test_replay_functionality(self, registration_ref: str):
         """Test notification replay functionality"""
         
-        logger.info("🔄 Testing notification replay functionality")
+        # Replay notifications from 24 hours ago
+        start_time = (datetime.now(timezone.utc) - timedelta(hours=24)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        log = logger.bind(registration=registration_ref, start_time=start_time)
+        
+        log.info("🔄 Testing notification replay functionality")
         
         try:
-            # Replay notifications from 24 hours ago
-            start_time = (datetime.utcnow() - timedelta(hours=24)).isoformat() + "Z"
             
             replayed_notifications = await self.service.replay_notifications(
                 registration_ref,
                 start_time
             )
             
-            logger.info("✅ Notification replay completed",
-                       replayed_count=len(replayed_notifications))
+            log.info("✅ Notification replay completed",
+                    replayed_count=len(replayed_notifications))
             
-            for notification in replayed_notifications:
-                logger.info("🔄 Replayed notification",
-                           duns=notification.duns,
-                           type=notification.type.value,
-                           original_time=notification.delivery_timestamp)
+            for notification in (replayed_notifications if log.is_enabled_for(logging.INFO) else ()):
+                log.info("🔄 Replayed notification",
+                        duns=notification.duns,
+                        type=notification.type.value,
+                        original_time=notification.delivery_timestamp)
             
             return replayed_notifications
             
         except Exception as e:
-            logger.error("❌ Replay functionality test failed", error=str(e))
+            log.error("❌ Replay functionality test failed", error=str(e))
             raise
     
     async def cleanup(self):
@@ -286,8 +508,9 @@ class RealTimeTestRunner:
             for ref, info in self.active_registrations.items():
                 logger.info("📝 Active test registration",
                            reference=ref,
-                           created=info['created_at'],
-                           duns_count=len(info['duns_list']))
+                           registration_id=info.registration_id,
+                           created=info.created_at,
+                           duns_count=len(info.duns_list))
             
             if self.service:
                 await self.service.shutdown()
@@ -295,176 +518,232 @@ class RealTimeTestRunner:
                 
         except Exception as e:
             logger.error("❌ Cleanup failed", error=str(e))
+    
+    async def __aenter__(self):
+        """Set up the service once; its pooled API session is reused by every test"""
+        if not await self.setup():
+            raise RuntimeError("Failed to setup test runner")
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Shut the service down, closing its HTTP sessions"""
+        await self.cleanup()
 
 
-async def run_comprehensive_test():
-    """Run a comprehensive real-time testing scenario"""
+def _orjson_log_serializer(event_dict, **kwargs) -> str:
+    """JSONRenderer serializer backed by orjson, which handles datetimes natively"""
+    return orjson.dumps(event_dict, default=kwargs.get("default")).decode()
+
+
+def _log_renderer():
+    """Render for humans on a terminal, otherwise as JSON lines"""
+    if sys.stderr.isatty():
+        return structlog.dev.ConsoleRenderer()
+    if orjson is not None:
+        return structlog.processors.JSONRenderer(serializer=_orjson_log_serializer)
+    return structlog.processors.JSONRenderer()
+
+
+_stack_info_renderer = structlog.processors.StackInfoRenderer()
+
+
+def _render_exception_info(logger, method_name, event_dict):
+    """Run the stack/exception renderers only for events that carry that info"""
+    if "stack_info" in event_dict:
+        event_dict = _stack_info_renderer(logger, method_name, event_dict)
+    if "exc_info" in event_dict:
+        event_dict = structlog.processors.format_exc_info(logger, method_name, event_dict)
+    return event_dict
+
+
+def _configure_logging():
+    """
+    Configure structlog with a level-filtering logger
     
-    # Setup logging
+    Calls below INFO become no-ops without going through the stdlib logging
+    module, and is_enabled_for() lets the runner skip building events.
+    """
     structlog.configure(
         processors=[
-            structlog.stdlib.filter_by_level,
-            structlog.stdlib.add_logger_name,
-            structlog.stdlib.add_log_level,
-            structlog.stdlib.PositionalArgumentsFormatter(),
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
+            structlog.processors.add_log_level,
+            structlog.processors.TimeStamper(fmt="iso", utc=True),
+            _render_exception_info,
             structlog.processors.UnicodeDecoder(),
-            structlog.dev.ConsoleRenderer(),
+            _log_renderer(),
         ],
         context_class=dict,
-        logger_factory=structlog.stdlib.LoggerFactory(),
-        wrapper_class=structlog.stdlib.BoundLogger,
+        logger_factory=structlog.PrintLoggerFactory(sys.stderr),
+        wrapper_class=structlog.make_filtering_bound_logger(logging.INFO),
         cache_logger_on_first_use=True,
     )
+
+
+async def run_comprehensive_test():
+    """Run a comprehensive real-time testing scenario"""
     
-    logger.info("🚀 Starting comprehensive real-time testing")
+    _configure_logging()
     
-    # Initialize test runner
-    test_runner = RealTimeTestRunner()
+    logger.info("🚀 Starting comprehensive real-time testing")
     
     try:
-        # Setup
-        if not await test_runner.setup():
-            logger.error("Failed to setup test runner")
-            return False
-        
-        # Test authentication
-        if not await test_runner.test_authentication():
-            logger.error("Authentication test failed")
-            return False
-        
-        # REPLACE THESE WITH ACTUAL DUNS NUMBERS FROM YOUR DEV REGISTRATION
-        test_duns = [
-            "123456789",  # Replace with real DUNS
-            "987654321",  # Replace with real DUNS
-            "555666777"   # Replace with real DUNS
-        ]
-        
-        logger.warning("⚠️  IMPORTANT: Replace test DUNS numbers with real ones from your dev registration")
-        logger.info("📋 Test DUNS numbers", duns_list=test_duns)
-        
-        # Create test registration
-        registration_ref = await test_runner.create_test_registration(
-            name="Real Time Test",
-            duns_list=test_duns,
-            monitoring_type="standard"
-        )
-        
-        # Test notification pull
-        await test_runner.test_pull_notifications(registration_ref, max_notifications=10)
-        
-        # Test replay functionality
-        await test_runner.test_replay_functionality(registration_ref)
-        
-        # Run real-time monitoring for 3 minutes
-        notification_count = await test_runner.activate_and_monitor(
-            registration_ref,
-            duration_minutes=3,
-            polling_interval=30
-        )
-        
-        logger.info("🎉 Comprehensive testing completed successfully",
-                   total_notifications=notification_count)
-        
-        return True
+        # Initialize test runner; all tests share its service and connections
+        async with RealTimeTestRunner() as test_runner:
+            # Test authentication
+            if not await test_runner.test_authentication():
+                logger.error("Authentication test failed")
+                return False
+            
+            # REPLACE THESE WITH ACTUAL DUNS NUMBERS FROM YOUR DEV REGISTRATION
+            test_duns = [
+                "123456789",  # Replace with real DUNS
+                "987654321",  # Replace with real DUNS
+                "555666777"   # Replace with real DUNS
+            ]
+            
+            logger.warning("⚠️  IMPORTANT: Replace test DUNS numbers with real ones from your dev registration")
+            logger.info("📋 Test DUNS numbers", duns_list=test_duns)
+            
+            # Create test registration
+            registration_ref = await test_runner.create_test_registration(
+                name="Real Time Test",
+                duns_list=test_duns,
+                monitoring_type="standard"
+            )
+            
+            # Test notification pull
+            await test_runner.test_pull_notifications(registration_ref, max_notifications=10)
+            
+            # Test replay functionality
+            await test_runner.test_replay_functionality(registration_ref)
+            
+            # Run real-time monitoring for 3 minutes
+            notification_count = await test_runner.activate_and_monitor(
+                registration_ref,
+                duration_minutes=3,
+                polling_interval=30
+            )
+            
+            logger.info("🎉 Comprehensive testing completed successfully",
+                       total_notifications=notification_count)
+            
+            return True
         
     except Exception as e:
         logger.error("❌ Comprehensive test failed", error=str(e))
         return False
-        
-    finally:
-        await test_runner.cleanup()
 
 
-@click.command()
-@click.option('--duns', '-d', multiple=True, help='DUNS numbers to test with (from your dev registration)')
-@click.option('--duns-file', '-f', help='CSV file containing DUNS numbers')
-@click.option('--duns-column', '-c', default='duns', help='Column name for DUNS in CSV file')
-@click.option('--monitoring-type', '-t', default='standard', 
-              type=click.Choice(['standard', 'financial']), help='Type of monitoring')
-@click.option('--duration', '-dur', default=5, help='Monitoring duration in minutes')
-@click.option('--polling-interval', '-p', default=30, help='Polling interval in seconds')
-@click.option('--max-duns', default=20, help='Maximum DUNS to process from CSV file')
-def run_real_time_test(duns, duns_file, duns_column, monitoring_type, duration, polling_interval, max_duns):
+def run_real_time_test(
+    duns: List[str],
+    duns_file: Optional[str],
+    duns_column: str,
+    monitoring_type: str,
+    duration: int,
+    polling_interval: int,
+    max_duns: int
+) -> bool:
     """Run real-time monitoring test with your dev registration entity"""
+    # click is only needed on this path; _cli_main has imported it already
+    import click
     
-    # Load DUNS from various sources
-    duns_list = list(duns) if duns else []
+    # DUNS given on the command line; a CSV file is streamed in after the
+    # registration is created. Duplicates and malformed values are dropped
+    # here rather than sent to D&B.
+    duns_list = [d for d in dict.fromkeys(duns) if _DUNS_RE.fullmatch(d)]
     
-    # Load from CSV file if provided
-    if duns_file:
-        try:
-            from duns_csv_loader import DunsCSVLoader
-            loader = DunsCSVLoader()
-            csv_duns = loader.load_from_csv(duns_file, duns_column)
-            
-            # Limit number of DUNS if requested
-            if len(csv_duns) > max_duns:
-                click.echo(f"⚠️  CSV contains {len(csv_duns)} DUNS, limiting to first {max_duns}")
-                csv_duns = csv_duns[:max_duns]
-            
-            duns_list.extend(csv_duns)
-            click.echo(f"✅ Loaded {len(csv_duns)} DUNS numbers from CSV: {duns_file}")
-            
-        except Exception as e:
-            click.echo(f"❌ Error loading CSV file: {e}", err=True)
-            return
+    if len(duns_list) < len(duns):
+        click.echo(f"⚠️  Skipped {len(duns) - len(duns_list)} duplicate or invalid DUNS numbers")
     
-    if not duns_list:
+    if not duns_list and not duns_file:
         click.echo("❌ Please provide DUNS numbers using one of these methods:")
         click.echo("  • Individual DUNS: -d 123456789 -d 987654321")
         click.echo("  • CSV file: -f your_duns.csv")
         click.echo("  • Both: -d 123456789 -f additional_duns.csv")
-        return
+        return True
+    
+    if duns_list:
+        click.echo(f"📋 Testing with {len(duns_list)} DUNS numbers")
+        for i, duns_num in enumerate(duns_list, 1):
+            click.echo(f"  {i:2d}. {duns_num}")
+    
+    if duns_file:
+        click.echo(f"📄 Streaming up to {max_duns} DUNS numbers from CSV: {duns_file}")
     
-    click.echo(f"📋 Testing with {len(duns_list)} DUNS numbers")
-    for i, duns_num in enumerate(duns_list, 1):
-        click.echo(f"  {i:2d}. {duns_num}")
+    _configure_logging()
     
     async def test_with_params():
-        test_runner = RealTimeTestRunner()
-        
         try:
-            # Setup and authenticate
-            if not await test_runner.setup():
-                return False
-            
-            if not await test_runner.test_authentication():
-                return False
-            
-            # Create registration with provided DUNS
-            registration_ref = await test_runner.create_test_registration(
-                name="Custom Real Time Test",
-                duns_list=duns_list,
-                monitoring_type=monitoring_type
-            )
-            
-            # Run monitoring
-            notification_count = await test_runner.activate_and_monitor(
-                registration_ref,
-                duration_minutes=duration,
-                polling_interval=polling_interval
-            )
-            
-            click.echo(f"✅ Test completed! Processed {notification_count} notifications")
-            return True
+            async with RealTimeTestRunner() as test_runner:
+                if not await test_runner.test_authentication():
+                    return False
+                
+                # Create registration with provided DUNS
+                registration_ref = await test_runner.create_test_registration(
+                    name="Custom Real Time Test",
+                    duns_list=duns_list,
+                    monitoring_type=monitoring_type
+                )
+                
+                if duns_file:
+                    added = await test_runner.stream_duns_from_csv(
+                        registration_ref,
+                        duns_file,
+                        duns_column,
+                        max_duns=max_duns
+                    )
+                    click.echo(f"✅ Added {added} DUNS numbers from CSV: {duns_file}")
+                
+                # Run monitoring
+                notification_count = await test_runner.activate_and_monitor(
+                    registration_ref,
+                    duration_minutes=duration,
+                    polling_interval=polling_interval
+                )
+                
+                click.echo(f"✅ Test completed! Processed {notification_count} notifications")
+                return True
             
         except Exception as e:
             click.echo(f"❌ Test failed: {e}")
             return False
-        finally:
-            await test_runner.cleanup()
     
-    success = asyncio.run(test_with_params())
-    sys.exit(0 if success else 1)
+    return asyncio.run(test_with_params())
+
+
+def _cli_main():
+    """
+    Build and run the click command
+    
+    click is imported here, so running the comprehensive test without
+    arguments never loads it.
+    """
+    import click
+    
+    @click.command()
+    @click.option('--duns', '-d', multiple=True, help='DUNS numbers to test with (from your dev registration)')
+    @click.option('--duns-file', '-f', help='CSV file containing DUNS numbers')
+    @click.option('--duns-column', '-c', default='duns', help='Column name for DUNS in CSV file')
+    @click.option('--monitoring-type', '-t', default='standard', 
+                  type=click.Choice(['standard', 'financial']), help='Type of monitoring')
+    @click.option('--duration', '-dur', default=5, help='Monitoring duration in minutes')
+    @click.option('--polling-interval', '-p', default=30, help='Polling interval in seconds')
+    @click.option('--max-duns', default=20, help='Maximum DUNS to process from CSV file')
+    def cli(duns, duns_file, duns_column, monitoring_type, duration, polling_interval, max_duns):
+        """Run real-time monitoring test with your dev registration entity"""
+        success = run_real_time_test(
+            duns, duns_file, duns_column, monitoring_type, duration, polling_interval, max_duns
+        )
+        click.get_current_context().exit(0 if success else 1)
+    
+    cli()
 
 
 if __name__ == "__main__":
+    install_uvloop()
+    
     # If run with command line arguments, use click
     if len(sys.argv) > 1:
-        run_real_time_test()
+        _cli_main()
     else:
         # Run comprehensive test
         success = asyncio.run(run_comprehensive_test())
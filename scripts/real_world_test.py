@@ -9,9 +9,19 @@ import sys
 import os
 import time
 import json
+import math
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+try:
+    import orjson
+except ImportError:  # Optional dependency, falls back to the stdlib encoder
+    orjson = None
 
 # Add src to Python path
 src_path = Path(__file__).parent.parent / "src"
@@ -26,7 +36,123 @@ from traceone_monitoring.services.local_file_notification_handler import (
     LocalFileStorageConfig,
     LocalFileNotificationHandler
 )
-from traceone_monitoring.models.notification import Notification
+from traceone_monitoring.models.notification import Notification, NotificationElement
+from traceone_monitoring.utils.event_loop import install_uvloop
+
+# Most recent notifications kept in memory by the test handler
+NOTIFICATION_LOG_SIZE = 10_000
+
+# SFTP drop directory the real-world tests read from, expanded once
+SFTP_DIR = Path(os.path.expanduser("~/Library/Mobile Documents/com~apple~CloudDocs/Projects/Traceone/dev/sftp"))
+
+
+class _GlobCache:
+    """One os.scandir listing per directory, shared by every lookup in a run"""
+    
+    def __init__(self):
+        self._entries: Dict[Path, List[os.DirEntry]] = {}
+    
+    def entries(self, directory: Path) -> List[os.DirEntry]:
+        """List a directory once; later calls reuse the cached entries"""
+        if directory not in self._entries:
+            # Hidden entries (e.g. .DS_Store) are skipped, as glob("*") does
+            with os.scandir(directory) as it:
+                self._entries[directory] = [e for e in it if not e.name.startswith(".")]
+        return self._entries[directory]
+    
+    def files(self, directory: Path, suffix: str = "") -> List[Path]:
+        """Regular files in a directory, optionally filtered by suffix"""
+        # is_file() answers from the scandir result without another stat()
+        return [
+            Path(entry.path) for entry in self.entries(directory)
+            if entry.name.endswith(suffix) and entry.is_file()
+        ]
+    
+    def invalidate(self, directory: Path):
+        """Drop a listing that is known to have changed"""
+        self._entries.pop(directory, None)
+
+
+_glob_cache = _GlobCache()
+
+
+def _scan_json(root: Path) -> List[str]:
+    """Paths of all .json files under root, walked with os.scandir"""
+    found = []
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                # DirEntry type checks reuse the scandir result, no extra stat()
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".json") and entry.is_file():
+                    found.append(entry.path)
+    return found
+
+
+def _json_default(value: Any) -> str:
+    """Encode the UUIDs and datetimes orjson handles natively for the stdlib fallback"""
+    return value.isoformat() if isinstance(value, datetime) else str(value)
+
+
+def _notification_default(value: Any) -> Any:
+    """Encode notifications as their stored summary, straight from the models"""
+    if isinstance(value, Notification):
+        elements = value.elements
+        return {
+            "id": value.id,
+            "type": value.type.value,
+            "duns": value.duns,
+            "elements_count": len(elements),
+            "delivery_timestamp": value.delivery_timestamp,
+            "sample_elements": elements[:3]  # Show first 3 elements
+        }
+    if isinstance(value, NotificationElement):
+        return {
+            "element": value.element,
+            "has_current_value": value.current is not None,
+            "timestamp": value.timestamp
+        }
+    return _json_default(value)
+
+
+def _dump_json(data: Any, default=_json_default, indent: bool = True) -> bytes:
+    """Serialize to JSON, with orjson when it is installed; indent for human-read files"""
+    if orjson is not None:
+        return orjson.dumps(data, default=default, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(data, indent=2, default=default).encode()
+    return json.dumps(data, separators=(",", ":"), default=default).encode()
+
+
+def _load_json(path: Path) -> Any:
+    """Parse a JSON file, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_bytes())
+
+
+@dataclass
+class NotificationRecord:
+    """Summary of a handled notification kept in the handler's in-memory log"""
+    __slots__ = ('id', 'type', 'duns', 'elements_count', 'delivery_timestamp')
+    
+    id: UUID
+    type: str
+    duns: str
+    elements_count: int
+    delivery_timestamp: Optional[datetime]
+    
+    @classmethod
+    def from_notification(cls, notification: Notification) -> "NotificationRecord":
+        return cls(
+            notification.id,
+            notification.type.value,
+            notification.duns,
+            len(notification.elements),
+            notification.delivery_timestamp,
+        )
 
 
 class RealWorldTestResults:
@@ -34,21 +160,31 @@ class RealWorldTestResults:
     
     def __init__(self):
         self.start_time = datetime.now()
+        self._start_mono = time.monotonic()
         self.notifications_processed = 0
         self.files_processed = 0
         self.notifications_stored = 0
         self.errors = []
-        self.processing_times = []
+        # Welford running mean/variance keeps get_summary O(1) without
+        # storing every sample
+        self._processing_time_count = 0
+        self._processing_time_mean = 0.0
+        self._processing_time_m2 = 0.0
         
     def add_processing_time(self, duration: float):
-        self.processing_times.append(duration)
+        self._processing_time_count += 1
+        delta = duration - self._processing_time_mean
+        self._processing_time_mean += delta / self._processing_time_count
+        self._processing_time_m2 += delta * (duration - self._processing_time_mean)
         
     def add_error(self, error: str):
         self.errors.append(f"{datetime.now()}: {error}")
         
     def get_summary(self) -> Dict:
-        total_time = (datetime.now() - self.start_time).total_seconds()
-        avg_processing_time = sum(self.processing_times) / len(self.processing_times) if self.processing_times else 0
+        total_time = time.monotonic() - self._start_mono
+        count = self._processing_time_count
+        avg_processing_time = self._processing_time_mean if count else 0
+        stddev_processing_time = math.sqrt(self._processing_time_m2 / (count - 1)) if count > 1 else 0
         
         return {
             "total_test_duration": total_time,
@@ -56,6 +192,7 @@ class RealWorldTestResults:
             "files_processed": self.files_processed,
             "notifications_stored": self.notifications_stored,
             "average_processing_time": avg_processing_time,
+            "processing_time_stddev": stddev_processing_time,
             "throughput_notifications_per_second": self.notifications_processed / total_time if total_time > 0 else 0,
             "error_count": len(self.errors),
             "errors": self.errors[:5]  # Show first 5 errors
@@ -69,60 +206,68 @@ class TestNotificationHandler:
         self.test_results = test_results
         self.output_dir = output_dir
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        self.notification_log = []
+        # Bounded so long runs drop the oldest entries instead of growing
+        self.notification_log = deque(maxlen=NOTIFICATION_LOG_SIZE)
+        # Encoding and writing run here so the service can move on to the
+        # next batch; flush() waits for whatever is still in flight
+        self._writer = ThreadPoolExecutor(max_workers=2, thread_name_prefix="notification-writer")
+        self._pending_writes = []
         
-    def handle_notifications(self, notifications: List[Notification]):
+    async def handle_notifications(self, notifications: List[Notification]):
         """Handle notifications and track results"""
-        start_time = time.time()
+        start_time = time.monotonic()
         
         try:
-            # Process notifications
-            for notification in notifications:
-                self.notification_log.append({
-                    "id": str(notification.id),
-                    "type": notification.type.value,
-                    "duns": notification.duns,
-                    "elements_count": len(notification.elements),
-                    "timestamp": notification.delivery_timestamp.isoformat() if hasattr(notification, 'delivery_timestamp') else None
-                })
+            # Slotted summaries, so the log doesn't keep whole models and
+            # their element lists alive
+            self.notification_log.extend(map(NotificationRecord.from_notification, notifications))
             
-            # Save notifications to file (simulating storage)
+            # Save notifications to file (simulating storage); the encoder
+            # walks the models itself, so no intermediate dicts are built here
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             output_file = self.output_dir / f"notifications_{timestamp}.json"
-            
-            with output_file.open('w') as f:
-                json.dump([
-                    {
-                        "id": str(n.id),
-                        "type": n.type.value,
-                        "duns": n.duns,
-                        "elements_count": len(n.elements),
-                        "delivery_timestamp": n.delivery_timestamp.isoformat() if hasattr(n, 'delivery_timestamp') else None,
-                        "sample_elements": [
-                            {
-                                "element": elem.element,
-                                "has_current_value": elem.current is not None,
-                                "timestamp": elem.timestamp.isoformat()
-                            } for elem in n.elements[:3]  # Show first 3 elements
-                        ]
-                    } for n in notifications
-                ], f, indent=2)
+            write = asyncio.get_running_loop().run_in_executor(
+                self._writer, self._write_notifications, output_file, notifications
+            )
+            self._pending_writes.append(write)
             
             # Update test results
             self.test_results.notifications_processed += len(notifications)
-            self.test_results.notifications_stored += len(notifications)
             
-            processing_time = time.time() - start_time
+            processing_time = time.monotonic() - start_time
             self.test_results.add_processing_time(processing_time)
             
             print(f"✅ Processed {len(notifications)} notifications in {processing_time:.2f}s")
-            print(f"   Saved to: {output_file}")
+            print(f"   Saving to: {output_file}")
             print(f"   Sample DUNS: {[n.duns for n in notifications[:5]]}")
             
         except Exception as e:
             error_msg = f"Failed to handle notifications: {e}"
             self.test_results.add_error(error_msg)
             print(f"❌ {error_msg}")
+    
+    @staticmethod
+    def _write_notifications(output_file: Path, notifications: List[Notification]) -> int:
+        """Encode and write one batch; runs on the writer thread"""
+        # Compact output: these files are bulk data, only the summaries are pretty-printed
+        output_file.write_bytes(_dump_json(notifications, default=_notification_default, indent=False))
+        return len(notifications)
+    
+    async def flush(self) -> int:
+        """Wait for queued writes and count what was stored; returns how many were waited on"""
+        pending, self._pending_writes = self._pending_writes, []
+        for result in await asyncio.gather(*pending, return_exceptions=True):
+            if isinstance(result, Exception):
+                error_msg = f"Failed to store notifications: {result}"
+                self.test_results.add_error(error_msg)
+                print(f"❌ {error_msg}")
+            else:
+                self.test_results.notifications_stored += result
+        return len(pending)
+    
+    def close(self):
+        """Stop the writer threads"""
+        self._writer.shutdown(wait=True)
 
 
 async def run_real_world_test():
@@ -142,14 +287,19 @@ async def run_real_world_test():
     notifications_dir.mkdir(exist_ok=True)
     logs_dir.mkdir(exist_ok=True)
     
-    print(f"📁 Test output directory: {output_dir.absolute()}")
+    abs_output_dir = output_dir.absolute()
+    print(f"📁 Test output directory: {abs_output_dir}")
+    
+    # Encoded summary from Test 5, reused for the final results file
+    summary_json = None
+    test_handler = None
     
     try:
         # Test 1: File Discovery and Initial Processing
         print("\n=== Test 1: File Discovery ===")
         config = LocalFileMonitoringConfig(
             enabled=True,
-            input_directory="~/Library/Mobile Documents/com~apple~CloudDocs/Projects/Traceone/dev/sftp",
+            input_directory=str(SFTP_DIR),
             polling_interval=60,
             auto_archive_processed=False,  # Don't move files during testing
             registration_reference="real-world-test"
@@ -176,23 +326,25 @@ async def run_real_world_test():
         
         # Test 2: One-time Processing
         print("\n=== Test 2: One-time File Processing ===")
-        start_time = time.time()
+        start_time = time.monotonic()
         
         notifications = await local_service.process_files_once()
         
-        processing_time = time.time() - start_time
+        processing_time = time.monotonic() - start_time
         print(f"✅ Processed {len(notifications)} notifications in {processing_time:.2f}s")
         print(f"   Throughput: {len(notifications) / processing_time:.1f} notifications/second")
         
         # Test 3: Verify Output Files
         print("\n=== Test 3: Output Verification ===")
-        output_files = list(notifications_dir.glob("*.json"))
+        await test_handler.flush()
+        # The handler has written into the directory since any earlier listing
+        _glob_cache.invalidate(notifications_dir)
+        output_files = _glob_cache.files(notifications_dir, ".json")
         print(f"✅ Generated {len(output_files)} output files")
         
         if output_files:
             # Check first output file
-            with output_files[0].open() as f:
-                sample_data = json.load(f)
+            sample_data = _load_json(output_files[0])
             print(f"   Sample file contains {len(sample_data)} notifications")
             if sample_data:
                 print(f"   Sample notification types: {set(n['type'] for n in sample_data)}")
@@ -218,60 +370,72 @@ async def run_real_world_test():
             # Check if files were created
             storage_output_dir = Path(storage_config.base_path)
             if storage_output_dir.exists():
-                storage_files = list(storage_output_dir.rglob("*.json"))
-                print(f"✅ Storage handler created {len(storage_files)} files")
+                storage_files = _scan_json(storage_output_dir)
+                report = [f"✅ Storage handler created {len(storage_files)} files"]
                 
                 # Show storage organization
                 for file_path in storage_files[:3]:  # Show first 3
-                    relative_path = file_path.relative_to(storage_output_dir)
-                    print(f"   📄 {relative_path}")
+                    relative_path = os.path.relpath(file_path, storage_output_dir)
+                    report.append(f"   📄 {relative_path}")
+                print("\n".join(report))
         
         # Test 5: Performance Metrics
         print("\n=== Test 5: Performance Analysis ===")
         summary = test_results.get_summary()
         
-        print(f"📊 Test Results Summary:")
-        print(f"   Total Duration: {summary['total_test_duration']:.2f} seconds")
-        print(f"   Files Processed: {summary['files_processed']}")
-        print(f"   Notifications Processed: {summary['notifications_processed']}")
-        print(f"   Notifications Stored: {summary['notifications_stored']}")
-        print(f"   Average Processing Time: {summary['average_processing_time']:.3f} seconds")
-        print(f"   Throughput: {summary['throughput_notifications_per_second']:.1f} notifications/second")
-        print(f"   Errors: {summary['error_count']}")
+        # Each report is assembled first and written with a single print
+        report = [
+            f"📊 Test Results Summary:",
+            f"   Total Duration: {summary['total_test_duration']:.2f} seconds",
+            f"   Files Processed: {summary['files_processed']}",
+            f"   Notifications Processed: {summary['notifications_processed']}",
+            f"   Notifications Stored: {summary['notifications_stored']}",
+            f"   Average Processing Time: {summary['average_processing_time']:.3f} seconds",
+            f"   Throughput: {summary['throughput_notifications_per_second']:.1f} notifications/second",
+            f"   Errors: {summary['error_count']}",
+        ]
         
         if summary['errors']:
-            print(f"   Recent Errors:")
-            for error in summary['errors']:
-                print(f"     - {error}")
+            report.append(f"   Recent Errors:")
+            report.extend(f"     - {error}" for error in summary['errors'])
+        print("\n".join(report))
         
         # Save detailed results
         results_file = output_dir / "test_results.json"
-        with results_file.open('w') as f:
-            json.dump(summary, f, indent=2)
+        summary_json = _dump_json(summary)
+        results_file.write_bytes(summary_json)
         
         print(f"\n📋 Detailed results saved to: {results_file}")
         
         # Test 6: Service Status Check
         print("\n=== Test 6: Service Status ===")
         status = local_service.get_status()
-        print("🔍 Service Status:")
-        for key, value in status.items():
-            print(f"   {key}: {value}")
+        report = ["🔍 Service Status:"]
+        report.extend(f"   {key}: {value}" for key, value in status.items())
+        print("\n".join(report))
         
         print("\n🎉 Real-World Test Completed Successfully!")
-        print(f"📁 All test outputs saved to: {output_dir.absolute()}")
+        print(f"📁 All test outputs saved to: {abs_output_dir}")
         
     except Exception as e:
         test_results.add_error(str(e))
+        summary_json = None  # The error must show up in the final results
         print(f"\n❌ Test failed with error: {e}")
         import traceback
         traceback.print_exc()
     
     finally:
+        if test_handler is not None:
+            # Writes still in flight change the stored count
+            if await test_handler.flush():
+                summary_json = None
+            test_handler.close()
+        
         # Save final results regardless of success/failure
         final_results_file = output_dir / "final_test_results.json"
-        with final_results_file.open('w') as f:
-            json.dump(test_results.get_summary(), f, indent=2)
+        if summary_json is None:
+            summary_json = _dump_json(test_results.get_summary())
+        final_results_file.write_bytes(summary_json)
 
 
 def print_pre_test_info():
@@ -283,9 +447,9 @@ def print_pre_test_info():
     print("4. Optionally set environment variables for D&B API (not required for local file test)")
     print()
     
-    sftp_dir = Path("~/Library/Mobile Documents/com~apple~CloudDocs/Projects/Traceone/dev/sftp").expanduser()
+    sftp_dir = SFTP_DIR
     if sftp_dir.exists():
-        files = list(sftp_dir.glob("*"))
+        files = _glob_cache.entries(sftp_dir)
         print(f"✅ SFTP directory found with {len(files)} files")
     else:
         print("⚠️  SFTP directory not found - please verify the path")
@@ -294,6 +458,8 @@ def print_pre_test_info():
 
 
 if __name__ == "__main__":
+    install_uvloop()
+    
     try:
         print_pre_test_info()
         
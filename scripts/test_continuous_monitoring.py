@@ -5,10 +5,11 @@ Tests the real-time file monitoring functionality
 """
 
 import asyncio
+import os
 import sys
 import signal
+import time
 from pathlib import Path
-from datetime import datetime
 
 # Add src to Python path
 src_path = Path(__file__).parent.parent / "src"
@@ -18,6 +19,10 @@ from traceone_monitoring.services.local_file_monitoring_service import (
     LocalFileMonitoringConfig,
     create_local_file_monitoring_service
 )
+from traceone_monitoring.utils.event_loop import install_uvloop
+
+# SFTP drop directory the real-world tests read from, expanded once
+SFTP_DIR = Path(os.path.expanduser("~/Library/Mobile Documents/com~apple~CloudDocs/Projects/Traceone/dev/sftp"))
 
 
 class ContinuousTestHandler:
@@ -25,15 +30,20 @@ class ContinuousTestHandler:
     
     def __init__(self):
         self.notification_count = 0
-        self.start_time = datetime.now()
+        # Monotonic clock: rates aren't skewed by wall-clock adjustments
+        self._start_mono = time.monotonic()
+    
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the handler was created"""
+        return time.monotonic() - self._start_mono
     
     def handle_notifications(self, notifications):
         """Handle incoming notifications"""
         self.notification_count += len(notifications)
-        current_time = datetime.now()
-        elapsed = (current_time - self.start_time).total_seconds()
+        elapsed = self.elapsed
         
-        print(f"\n📨 {current_time.strftime('%H:%M:%S')} - Received {len(notifications)} notifications")
+        print(f"\n📨 {time.strftime('%H:%M:%S')} - Received {len(notifications)} notifications")
         print(f"   Total processed: {self.notification_count}")
         print(f"   Average rate: {self.notification_count / elapsed if elapsed > 0 else 0:.1f} notifications/second")
         
@@ -53,7 +63,7 @@ async def run_continuous_monitoring_test():
     # Create monitoring service
     config = LocalFileMonitoringConfig(
         enabled=True,
-        input_directory="~/Library/Mobile Documents/com~apple~CloudDocs/Projects/Traceone/dev/sftp",
+        input_directory=str(SFTP_DIR),
         polling_interval=30,  # Check every 30 seconds
         auto_archive_processed=False,  # Keep files for repeated testing
         registration_reference="continuous-test"
@@ -71,13 +81,28 @@ async def run_continuous_monitoring_test():
     print(f"🔄 To test: Add/modify files in the SFTP directory")
     print("\n" + "=" * 50)
     
+    # Ctrl+C sets the event, so the loop sleeps between polls instead of
+    # waking every second to check for it
+    stop_event = asyncio.Event()
+    
+    def request_stop():
+        print("\n🛑 Received interrupt signal, stopping monitoring...")
+        stop_event.set()
+    
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGINT, request_stop)
+    except NotImplementedError:
+        # No loop signal handlers on Windows; signal_handler raises
+        # KeyboardInterrupt there instead
+        pass
+    
     try:
         # Start monitoring
         await local_service.start_monitoring()
         
         # Keep running until interrupted
-        while True:
-            await asyncio.sleep(1)
+        await stop_event.wait()
+        print("\n🛑 Monitoring stopped")
             
     except asyncio.CancelledError:
         print("\n🛑 Monitoring stopped")
@@ -85,7 +110,7 @@ async def run_continuous_monitoring_test():
         await local_service.stop_monitoring()
         
         # Print final stats
-        elapsed = (datetime.now() - test_handler.start_time).total_seconds()
+        elapsed = test_handler.elapsed
         print(f"\n📊 Final Statistics:")
         print(f"   Duration: {elapsed:.1f} seconds")
         print(f"   Total notifications: {test_handler.notification_count}")
@@ -99,6 +124,8 @@ def signal_handler(signum, frame):
 
 
 if __name__ == "__main__":
+    install_uvloop()
+    
     # Set up signal handler for graceful shutdown
     signal.signal(signal.SIGINT, signal_handler)
     
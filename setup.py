@@ -54,6 +54,11 @@ setup(
             "pytest-mock>=3.10.0",
             "responses>=0.22.0",
         ],
+        "perf": [
+            "uvloop>=0.17.0; sys_platform != 'win32'",
+            "zstandard>=0.21.0",
+            "orjson>=3.8.0",
+        ],
     },
     entry_points={
         "console_scripts": [
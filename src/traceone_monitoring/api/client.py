@@ -2,9 +2,9 @@
 D&B API Client with rate limiting and comprehensive error handling
 """
 
+import threading
 import time
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
@@ -20,23 +20,29 @@ logger = structlog.get_logger(__name__)
 
 
 class RateLimiter:
-    """Rate limiter to enforce API call limits"""
+    """Token-bucket rate limiter to enforce API call limits across threads"""
     
     def __init__(self, calls_per_second: float):
         self.calls_per_second = calls_per_second
-        self.min_interval = 1.0 / calls_per_second
-        self.last_call_time = 0.0
+        # Up to one second's worth of calls may go out back to back
+        self.capacity = max(1.0, calls_per_second)
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
     
     def wait(self):
-        """Wait if necessary to respect rate limits"""
-        current_time = time.time()
-        time_since_last_call = current_time - self.last_call_time
+        """Take a token, sleeping only for the deficit when none is left"""
+        with self._lock:
+            now = time.monotonic()
+            tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.calls_per_second)
+            self.last_refill = now
+            # Reserve the token before sleeping (the bucket may go negative),
+            # so concurrent callers queue behind each other without holding
+            # the lock while they wait
+            self.tokens = tokens - 1
         
-        if time_since_last_call < self.min_interval:
-            sleep_time = self.min_interval - time_since_last_call
-            time.sleep(sleep_time)
-        
-        self.last_call_time = time.time()
+        if tokens < 1:
+            time.sleep((1 - tokens) / self.calls_per_second)
 
 
 class DNBApiError(Exception):
@@ -49,7 +55,9 @@ class DNBApiError(Exception):
 
 class RateLimitExceededError(DNBApiError):
     """Rate limit exceeded error"""
-    pass
+    def __init__(self, message: str, status_code: Optional[int] = None, retry_after: Optional[float] = None):
+        super().__init__(message, status_code)
+        self.retry_after = retry_after
 
 
 class NotFoundError(DNBApiError):
@@ -62,6 +70,35 @@ class ServerError(DNBApiError):
     pass
 
 
+# Upper bound on a server-requested Retry-After delay
+MAX_RETRY_AFTER = 60.0
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        # HTTP-date form; fall back to exponential backoff
+        return None
+
+
+def _wait_retry_after(fallback):
+    """Wait as long as the server asked for, otherwise use the fallback wait"""
+    def wait(retry_state) -> float:
+        exception = retry_state.outcome.exception() if retry_state.outcome else None
+        retry_after = getattr(exception, "retry_after", None)
+        if retry_after is not None:
+            return min(retry_after, MAX_RETRY_AFTER)
+        return fallback(retry_state)
+    return wait
+
+
+_RETRY_WAIT = _wait_retry_after(wait_exponential(multiplier=1, min=1, max=10))
+
+
 class DNBApiClient:
     """
     D&B API client with rate limiting, error handling, and automatic retries
@@ -79,6 +116,9 @@ class DNBApiClient:
         self.config = config
         self.rate_limiter = RateLimiter(config.rate_limit)
         self.base_url = config.base_url
+        # (token, headers) last built from the authenticator; replaced as a
+        # whole so concurrent callers never see a mismatched pair
+        self._cached_auth: Optional[Tuple[str, Dict[str, str]]] = None
         
         # Setup HTTP session with retry strategy
         self.session = requests.Session()
@@ -87,7 +127,8 @@ class DNBApiClient:
             backoff_factor=config.backoff_factor,
             status_forcelist=[500, 502, 503, 504],  # Don't retry 429 (rate limit)
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Keep enough pooled keep-alive connections for concurrent callers
+        adapter = HTTPAdapter(max_retries=retry_strategy, pool_maxsize=config.pool_maxsize)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
         
@@ -129,10 +170,11 @@ class DNBApiClient:
         # Prepare URL
         url = f"{self.base_url}{endpoint}"
         
-        # Prepare headers
-        request_headers = self.auth.get_auth_headers()
+        # Prepare headers; the shared auth dict is only copied when extra
+        # headers have to be merged in (requests doesn't mutate it)
+        request_headers = self._auth_headers()
         if headers:
-            request_headers.update(headers)
+            request_headers = {**request_headers, **headers}
         
         # Use configured timeout if not specified
         if timeout is None:
@@ -162,9 +204,10 @@ class DNBApiClient:
             elif response.status_code == 404:
                 raise NotFoundError("Resource not found", response.status_code, response.text)
             elif response.status_code == 429:
+                retry_after = _parse_retry_after(response.headers.get('Retry-After'))
                 logger.warning("Rate limit exceeded", 
-                              retry_after=response.headers.get('Retry-After'))
-                raise RateLimitExceededError("Rate limit exceeded", response.status_code)
+                              retry_after=retry_after)
+                raise RateLimitExceededError("Rate limit exceeded", response.status_code, retry_after)
             elif response.status_code >= 500:
                 raise ServerError(f"Server error: {response.status_code}", response.status_code, response.text)
             elif not response.ok:
@@ -187,9 +230,18 @@ class DNBApiClient:
             logger.error("API request error", method=method, url=url, error=str(e))
             raise DNBApiError(f"Request error: {e}")
     
+    def _auth_headers(self) -> Dict[str, str]:
+        """Authentication headers, rebuilt only when the token changes"""
+        token = self.auth.get_token()
+        cached = self._cached_auth
+        if cached is None or cached[0] != token:
+            cached = (token, self.auth.get_auth_headers())
+            self._cached_auth = cached
+        return cached[1]
+    
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
+        wait=_RETRY_WAIT,
         retry=retry_if_exception_type((RateLimitExceededError, ServerError))
     )
     def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None, **kwargs) -> requests.Response:
@@ -198,7 +250,7 @@ class DNBApiClient:
     
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
+        wait=_RETRY_WAIT,
         retry=retry_if_exception_type((RateLimitExceededError, ServerError))
     )
     def post(self, endpoint: str, json: Optional[Dict[str, Any]] = None, **kwargs) -> requests.Response:
@@ -207,7 +259,7 @@ class DNBApiClient:
     
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
+        wait=_RETRY_WAIT,
         retry=retry_if_exception_type((RateLimitExceededError, ServerError))
     )
     def patch(self, endpoint: str, json: Optional[Dict[str, Any]] = None, **kwargs) -> requests.Response:
@@ -216,7 +268,7 @@ class DNBApiClient:
     
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
+        wait=_RETRY_WAIT,
         retry=retry_if_exception_type((RateLimitExceededError, ServerError))
     )
     def delete(self, endpoint: str, **kwargs) -> requests.Response:
@@ -276,24 +328,32 @@ class ApiMetrics:
         self.server_errors = 0
         self.auth_errors = 0
         self.total_response_time = 0.0
-        self.start_time = datetime.utcnow()
+        # Uptime comes from the monotonic clock, immune to wall-clock changes
+        self._start = time.monotonic()
+        self._lock = threading.Lock()
     
     def record_request(self, success: bool, response_time: float, error_type: Optional[str] = None):
         """Record API request metrics"""
-        self.total_requests += 1
-        self.total_response_time += response_time
-        
-        if success:
-            self.successful_requests += 1
-        else:
-            self.failed_requests += 1
+        with self._lock:
+            self.total_requests += 1
+            self.total_response_time += response_time
             
-            if error_type == "rate_limit":
-                self.rate_limit_errors += 1
-            elif error_type == "server_error":
-                self.server_errors += 1
-            elif error_type == "auth_error":
-                self.auth_errors += 1
+            if success:
+                self.successful_requests += 1
+            else:
+                self.failed_requests += 1
+                
+                if error_type == "rate_limit":
+                    self.rate_limit_errors += 1
+                elif error_type == "server_error":
+                    self.server_errors += 1
+                elif error_type == "auth_error":
+                    self.auth_errors += 1
+    
+    @property
+    def uptime_seconds(self) -> float:
+        """Seconds since metrics collection started"""
+        return time.monotonic() - self._start
     
     @property
     def success_rate(self) -> float:
@@ -312,25 +372,27 @@ class ApiMetrics:
     @property
     def requests_per_minute(self) -> float:
         """Get requests per minute rate"""
-        uptime = (datetime.utcnow() - self.start_time).total_seconds()
+        uptime = self.uptime_seconds
         if uptime == 0:
             return 0.0
         return (self.total_requests / uptime) * 60
     
     def get_stats(self) -> Dict[str, Any]:
         """Get comprehensive statistics"""
-        return {
-            "total_requests": self.total_requests,
-            "successful_requests": self.successful_requests,
-            "failed_requests": self.failed_requests,
-            "success_rate": self.success_rate,
-            "average_response_time": self.average_response_time,
-            "requests_per_minute": self.requests_per_minute,
-            "rate_limit_errors": self.rate_limit_errors,
-            "server_errors": self.server_errors,
-            "auth_errors": self.auth_errors,
-            "uptime_seconds": (datetime.utcnow() - self.start_time).total_seconds(),
-        }
+        # Hold the lock so the counters form one consistent snapshot
+        with self._lock:
+            return {
+                "total_requests": self.total_requests,
+                "successful_requests": self.successful_requests,
+                "failed_requests": self.failed_requests,
+                "success_rate": self.success_rate,
+                "average_response_time": self.average_response_time,
+                "requests_per_minute": self.requests_per_minute,
+                "rate_limit_errors": self.rate_limit_errors,
+                "server_errors": self.server_errors,
+                "auth_errors": self.auth_errors,
+                "uptime_seconds": self.uptime_seconds,
+            }
 
 
 def create_api_client(config: DNBApiConfig, auth: DNBAuthenticator) -> DNBApiClient:
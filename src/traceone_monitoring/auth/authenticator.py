@@ -3,10 +3,12 @@ D&B API Authentication Module
 OAuth 2.0 token management with automatic refresh
 """
 
+import asyncio
 import base64
+import threading
 import time
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
@@ -17,6 +19,12 @@ from ..utils.config import DNBApiConfig
 
 logger = structlog.get_logger(__name__)
 
+# Tokens shared by every authenticator using the same credentials in this
+# process, keyed by a hash of the credentials
+_token_cache: Dict[int, Tuple[str, datetime]] = {}
+_refresh_locks: Dict[int, threading.Lock] = {}
+_cache_lock = threading.Lock()
+
 
 class AuthenticationError(Exception):
     """Authentication related errors"""
@@ -48,6 +56,11 @@ class DNBAuthenticator:
         self.token_expiry: Optional[datetime] = None
         self.refresh_buffer = timedelta(seconds=config.timeout)
         
+        # Share tokens and coalesce refreshes across instances with the same credentials
+        self._cache_key = hash((config.base_url, config.client_id, config.client_secret))
+        with _cache_lock:
+            self._refresh_lock = _refresh_locks.setdefault(self._cache_key, threading.Lock())
+        
         # Setup HTTP session with retry strategy
         self.session = requests.Session()
         retry_strategy = Retry(
@@ -76,7 +89,37 @@ class DNBAuthenticator:
         if self._is_token_valid():
             return self.token
         
-        return self._refresh_token()
+        with self._refresh_lock:
+            # Another caller may have refreshed while we waited
+            if self._adopt_cached_token():
+                return self.token
+            return self._refresh_token()
+    
+    async def get_token_async(self) -> str:
+        """
+        Get valid access token from async code
+        
+        A cached token is returned without leaving the event loop; only a
+        refresh is run in the default executor.
+        
+        Returns:
+            Valid access token
+            
+        Raises:
+            AuthenticationError: If authentication fails
+        """
+        if self._is_token_valid():
+            return self.token
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.get_token)
+    
+    def _adopt_cached_token(self) -> bool:
+        """Take over a still valid token cached for the same credentials"""
+        cached = _token_cache.get(self._cache_key)
+        if cached:
+            self.token, self.token_expiry = cached
+        return self._is_token_valid()
     
     def _is_token_valid(self) -> bool:
         """Check if current token is valid and not expiring soon"""
@@ -154,6 +197,7 @@ class DNBAuthenticator:
             
             # Calculate expiry time
             self.token_expiry = datetime.utcnow() + timedelta(seconds=expires_in)
+            _token_cache[self._cache_key] = (self.token, self.token_expiry)
             
             logger.info("D&B access token refreshed successfully", 
                        expires_in=expires_in,
@@ -171,6 +215,9 @@ class DNBAuthenticator:
     def invalidate_token(self):
         """Invalidate current token (force refresh on next request)"""
         logger.info("Invalidating D&B access token")
+        cached = _token_cache.get(self._cache_key)
+        if cached and cached[0] == self.token:
+            _token_cache.pop(self._cache_key, None)
         self.token = None
         self.token_expiry = None
     
@@ -5,9 +5,12 @@ Reads and processes notification files from local SFTP directory
 
 import json
 import csv
+import os
+import shutil
 import zipfile
 import gzip
 from datetime import datetime
+from fnmatch import fnmatchcase
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Generator, Union
 import structlog
@@ -87,16 +90,35 @@ class LocalFileInputProcessor:
         Returns:
             Dictionary mapping file types to file paths
         """
-        discovered_files = {}
+        patterns = self.config.file_patterns
+        discovered_files = {file_type: [] for file_type in patterns}
         
         try:
-            for file_type, pattern in self.config.file_patterns.items():
-                matching_files = list(self.input_path.glob(pattern))
-                discovered_files[file_type] = matching_files
-                
+            # Patterns spanning subdirectories still need a glob of their own
+            flat_patterns = {}
+            for file_type, pattern in patterns.items():
+                if "/" in pattern or os.sep in pattern:
+                    discovered_files[file_type] = list(self.input_path.glob(pattern))
+                else:
+                    flat_patterns[file_type] = pattern
+            
+            # Match every flat pattern against a single directory listing
+            # instead of walking the (possibly slow, synced) directory once
+            # per pattern
+            if flat_patterns:
+                with os.scandir(self.input_path) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        if name.startswith("."):  # glob skips hidden files too
+                            continue
+                        for file_type, pattern in flat_patterns.items():
+                            if fnmatchcase(name, pattern):
+                                discovered_files[file_type].append(Path(entry.path))
+            
+            for file_type, matching_files in discovered_files.items():
                 logger.debug(f"Discovered {file_type} files",
                            count=len(matching_files),
-                           pattern=pattern)
+                           pattern=patterns[file_type])
             
             total_files = sum(len(files) for files in discovered_files.values())
             logger.info("File discovery completed", 
@@ -529,7 +551,6 @@ class LocalFileInputProcessor:
                 
                 finally:
                     # Cleanup temporary directory
-                    import shutil
                     shutil.rmtree(temp_dir, ignore_errors=True)
         
         except Exception as e:
@@ -550,15 +571,17 @@ class LocalFileInputProcessor:
         
         archived_count = 0
         
+        # Create date-based subdirectory once for the whole batch
+        date_dir = self.archive_path / datetime.now().strftime('%Y-%m-%d')
+        date_dir.mkdir(exist_ok=True)
+        
         for file_path in files_to_archive:
             try:
-                # Create date-based subdirectory
-                date_dir = self.archive_path / datetime.now().strftime('%Y-%m-%d')
-                date_dir.mkdir(exist_ok=True)
-                
-                # Move file to archive
+                # Move file to archive; a rename within the filesystem, or a
+                # kernel-side copy (sendfile/fcopyfile) plus unlink when the
+                # archive directory lives on another one
                 archive_file_path = date_dir / file_path.name
-                file_path.rename(archive_file_path)
+                shutil.move(str(file_path), str(archive_file_path))
                 archived_count += 1
                 
                 logger.debug("File archived", 
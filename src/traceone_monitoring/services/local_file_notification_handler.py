@@ -122,6 +122,7 @@ class LocalFileNotificationHandler:
                 "organize_by_date": self.config.organize_by_date,
                 "organize_by_registration": self.config.organize_by_registration,
                 "compress_files": self.config.compress_files,
+                "compression": self.config.compression,
                 "statistics": stats
             }
             
@@ -154,6 +155,20 @@ class LocalFileNotificationHandler:
             logger.error("Failed to get storage stats", error=str(e))
             return {"error": str(e)}
     
+    def warm_up(self) -> bool:
+        """Pre-create the first-write directory and exercise a write"""
+        if not self.enabled:
+            return False
+        
+        try:
+            self.storage.warm_up()
+            logger.info("Local file storage warmed up")
+            return True
+            
+        except Exception as e:
+            logger.warning("Local file storage warm-up failed", error=str(e))
+            return False
+    
     def test_connection(self) -> bool:
         """Test local file storage connection/access"""
         if not self.enabled:
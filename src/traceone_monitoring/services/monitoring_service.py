@@ -392,9 +392,10 @@ class DNBMonitoringService:
                    notification_id=str(notification.id))
         
         try:
-            # Call all registered notification handlers
+            # Call all registered notification handlers with one shared batch
+            batch = [notification]
             for handler in self._notification_handlers:
-                handler([notification])
+                handler(batch)
             
             # Mark as processed
             notification.mark_processed()
@@ -562,6 +563,10 @@ class DNBMonitoringService:
         if hasattr(self.authenticator, 'session'):
             self.authenticator.session.close()
         
+        # Close any SFTP connection kept open between uploads
+        if self._sftp_handler and self._sftp_handler.storage:
+            self._sftp_handler.storage.disconnect()
+        
         logger.info("Monitoring service shutdown complete")
     
     async def __aenter__(self):
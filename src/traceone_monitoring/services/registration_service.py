@@ -3,6 +3,7 @@ Registration Management Service
 Handles D&B monitoring registration lifecycle
 """
 
+import threading
 import yaml
 from datetime import datetime
 from pathlib import Path
@@ -42,6 +43,8 @@ class RegistrationManager:
         """
         self.client = api_client
         self._registrations: Dict[str, Registration] = {}
+        # The async service runs these methods on executor threads
+        self._stats_lock = threading.Lock()
     
     def create_registration_from_config(self, config: RegistrationConfig) -> Registration:
         """
@@ -159,7 +162,8 @@ class RegistrationManager:
                     self._add_single_duns(registration_reference, duns)
             
             # Update registration statistics
-            registration.total_duns_monitored += len(duns_list)
+            with self._stats_lock:
+                registration.total_duns_monitored += len(duns_list)
             
             logger.info("Successfully added DUNS to monitoring",
                        registration=registration_reference,
@@ -219,7 +223,8 @@ class RegistrationManager:
                     self._remove_single_duns(registration_reference, duns)
             
             # Update registration statistics
-            registration.total_duns_monitored = max(0, registration.total_duns_monitored - len(duns_list))
+            with self._stats_lock:
+                registration.total_duns_monitored = max(0, registration.total_duns_monitored - len(duns_list))
             
             logger.info("Successfully removed DUNS from monitoring",
                        registration=registration_reference,
@@ -58,6 +58,7 @@ class SFTPNotificationHandler:
             remote_base_path=self.config.remote_base_path,
             file_format=self.config.file_format,
             compress_files=self.config.compress_files,
+            compression=self.config.compression,
             timeout=self.config.timeout,
             max_retries=self.config.max_retries,
             organize_by_date=self.config.organize_by_date,
@@ -131,8 +132,11 @@ class SFTPNotificationHandler:
             return False
         
         try:
+            # Leave an already open (e.g. warmed up) connection in place
+            was_connected = self.storage.sftp is not None
             self.storage.connect()
-            self.storage.disconnect()
+            if not was_connected:
+                self.storage.disconnect()
             logger.info("SFTP connection test successful")
             return True
             
@@ -140,6 +144,20 @@ class SFTPNotificationHandler:
             logger.error("SFTP connection test failed", error=str(e))
             return False
     
+    def warm_up(self) -> bool:
+        """Pre-open the SFTP connection and first-write path"""
+        if not self.enabled:
+            return False
+        
+        try:
+            self.storage.warm_up()
+            logger.info("SFTP storage warmed up")
+            return True
+            
+        except Exception as e:
+            logger.warning("SFTP storage warm-up failed", error=str(e))
+            return False
+    
     def get_storage_status(self) -> Dict[str, Any]:
         """Get SFTP storage status information"""
         if not self.enabled:
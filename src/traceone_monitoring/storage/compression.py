@@ -0,0 +1,45 @@
+"""
+Compression helpers shared by the notification storage backends
+"""
+
+import gzip
+from typing import Callable
+
+try:
+    import zstandard
+except ImportError:  # Optional dependency, only needed for zstd
+    zstandard = None
+
+
+# File suffix appended to compressed files per codec
+COMPRESSION_SUFFIXES = {
+    "gzip": ".gz",
+    "zstd": ".zst",
+}
+
+
+def create_compressor(codec: str) -> Callable[[bytes], bytes]:
+    """
+    Create a reusable in-memory compressor for the given codec
+
+    Args:
+        codec: Compression codec name (gzip, zstd)
+
+    Returns:
+        Function compressing a bytes payload
+
+    Raises:
+        ValueError: If the codec is unsupported or its library is missing
+    """
+    codec = codec.lower()
+
+    if codec == "gzip":
+        return gzip.compress
+
+    if codec == "zstd":
+        if zstandard is None:
+            raise ValueError("zstd compression requires the 'zstandard' package")
+        # ZstdCompressor setup is comparatively expensive; build it once
+        return zstandard.ZstdCompressor(level=3).compress
+
+    raise ValueError(f"Unsupported compression codec: {codec}")
@@ -9,11 +9,12 @@ import io
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
 import structlog
 from pydantic import BaseModel, Field
 
 from ..models.notification import Notification, NotificationBatch
+from .compression import COMPRESSION_SUFFIXES, create_compressor
 
 logger = structlog.get_logger(__name__)
 
@@ -23,6 +24,7 @@ class LocalFileConfig(BaseModel):
     base_path: str = Field(..., description="Base directory path for storage")
     file_format: str = Field(default="json", description="File format (json, csv, xml)")
     compress_files: bool = Field(default=False, description="Compress files after creation")
+    compression: str = Field(default="gzip", description="Compression codec when compress_files is enabled (gzip, zstd)")
     
     # File organization
     organize_by_date: bool = Field(default=True, description="Organize files by date")
@@ -57,6 +59,20 @@ class LocalFileNotificationStorage:
         self.config = config
         self.base_path = Path(config.base_path).expanduser().resolve()
         
+        # Directories already created in this process; lets repeated writes
+        # into the same date/registration folder skip mkdir + chmod syscalls
+        self._ensured_directories: set = set()
+        
+        # Compressor is built once and reused for every file
+        self._compressor = None
+        self._compressed_suffix = ""
+        if config.compress_files:
+            try:
+                self._compressor = create_compressor(config.compression)
+            except ValueError as e:
+                raise LocalFileStorageError(str(e))
+            self._compressed_suffix = COMPRESSION_SUFFIXES[config.compression.lower()]
+        
         # Ensure base directory exists
         self._ensure_directory(self.base_path)
         
@@ -86,15 +102,13 @@ class LocalFileNotificationStorage:
             # Format notifications
             file_content = self._format_notifications(notifications)
             
-            # Write file
-            self._write_file(file_path, file_content)
-            
-            # Compress if enabled
-            if self.config.compress_files:
-                compressed_path = self._compress_file(file_path)
-                final_path = compressed_path
+            # Compress in memory if enabled so the file is written only once
+            if self._compressor:
+                final_path = file_path.with_suffix(file_path.suffix + self._compressed_suffix)
+                self._write_file(final_path, self._compressor(file_content.encode('utf-8')))
             else:
                 final_path = file_path
+                self._write_file(final_path, file_content)
             
             result = {
                 "stored": len(notifications),
@@ -131,6 +145,21 @@ class LocalFileNotificationStorage:
         """
         return self.store_notifications(batch.notifications, batch.registration_id)
     
+    def warm_up(self, registration_reference: str = "default"):
+        """
+        Create today's target directory and exercise a first write
+        
+        Args:
+            registration_reference: Registration whose directory to prepare
+        """
+        directory_path = self._generate_file_path(registration_reference, 0).parent
+        
+        warmup_file = directory_path / ".warmup"
+        self._write_file(warmup_file, b"")
+        warmup_file.unlink()
+        
+        logger.debug("Local file storage warmed up", directory_path=str(directory_path))
+    
     def list_stored_files(self, registration_reference: Optional[str] = None) -> List[str]:
         """
         List stored notification files
@@ -155,7 +184,7 @@ class LocalFileNotificationStorage:
             for file_path in search_path.glob(search_pattern):
                 if file_path.is_file():
                     # Filter by supported extensions
-                    if file_path.suffix.lower() in ['.json', '.csv', '.xml', '.gz']:
+                    if file_path.suffix.lower() in ['.json', '.csv', '.xml', '.gz', '.zst']:
                         files.append(str(file_path))
             
             return sorted(files)
@@ -299,18 +328,27 @@ class LocalFileNotificationStorage:
         xml_lines.append('</notifications>')
         return '\n'.join(xml_lines)
     
-    def _write_file(self, file_path: Path, content: str):
+    def _write_file(self, file_path: Path, content: Union[str, bytes]):
         """Write content to file"""
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            # Encode once so the write and the size log share the same bytes
+            data = content.encode('utf-8') if isinstance(content, str) else content
+            try:
+                with open(file_path, 'wb') as f:
+                    f.write(data)
+            except FileNotFoundError:
+                # Cached directory was removed externally; recreate it once
+                self._ensured_directories.discard(file_path.parent)
+                self._ensure_directory(file_path.parent)
+                with open(file_path, 'wb') as f:
+                    f.write(data)
             
             # Set file permissions
             os.chmod(file_path, self.config.file_permissions)
             
             logger.debug("File written successfully",
                         file_path=str(file_path),
-                        size_bytes=len(content.encode('utf-8')))
+                        size_bytes=len(data))
             
         except Exception as e:
             logger.error("Failed to write file",
@@ -318,46 +356,19 @@ class LocalFileNotificationStorage:
                         error=str(e))
             raise LocalFileStorageError(f"Failed to write file {file_path}: {e}")
     
-    def _compress_file(self, file_path: Path) -> Path:
-        """Compress file using gzip"""
-        import gzip
-        
-        compressed_path = file_path.with_suffix(file_path.suffix + '.gz')
-        
-        try:
-            with open(file_path, 'rb') as f_in:
-                with gzip.open(compressed_path, 'wb') as f_out:
-                    f_out.writelines(f_in)
-            
-            # Remove original file
-            file_path.unlink()
-            
-            # Set compressed file permissions
-            os.chmod(compressed_path, self.config.file_permissions)
-            
-            logger.debug("File compressed successfully",
-                        original_path=str(file_path),
-                        compressed_path=str(compressed_path))
-            
-            return compressed_path
-            
-        except Exception as e:
-            logger.error("Failed to compress file",
-                        file_path=str(file_path),
-                        error=str(e))
-            # Clean up compressed file if it exists
-            if compressed_path.exists():
-                compressed_path.unlink()
-            raise LocalFileStorageError(f"Failed to compress file {file_path}: {e}")
-    
     def _ensure_directory(self, directory_path: Path):
         """Ensure directory exists with proper permissions"""
+        if directory_path in self._ensured_directories:
+            return
+        
         try:
             directory_path.mkdir(parents=True, exist_ok=True)
             
             # Set directory permissions
             os.chmod(directory_path, self.config.directory_permissions)
             
+            self._ensured_directories.add(directory_path)
+            
         except Exception as e:
             logger.error("Failed to create directory",
                         directory_path=str(directory_path),
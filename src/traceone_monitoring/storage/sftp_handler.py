@@ -8,12 +8,13 @@ import csv
 import io
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
 import paramiko
 import structlog
 from pydantic import BaseModel, Field
 
 from ..models.notification import Notification, NotificationBatch
+from .compression import COMPRESSION_SUFFIXES, create_compressor
 
 logger = structlog.get_logger(__name__)
 
@@ -33,6 +34,7 @@ class SFTPConfig(BaseModel):
     # File format options
     file_format: str = Field(default="json", description="File format (json, csv, xml)")
     compress_files: bool = Field(default=False, description="Compress files before upload")
+    compression: str = Field(default="gzip", description="Compression codec when compress_files is enabled (gzip, zstd)")
     
     # Connection settings
     timeout: int = Field(default=30, description="Connection timeout in seconds")
@@ -64,6 +66,16 @@ class SFTPNotificationStorage:
         self.client = None
         self.sftp = None
         
+        # Compressor is built once and reused for every upload
+        self._compressor = None
+        self._compressed_suffix = ""
+        if config.compress_files:
+            try:
+                self._compressor = create_compressor(config.compression)
+            except ValueError as e:
+                raise SFTPStorageError(str(e))
+            self._compressed_suffix = COMPRESSION_SUFFIXES[config.compression.lower()]
+        
         logger.info("SFTP Notification Storage initialized",
                    hostname=config.hostname,
                    port=config.port,
@@ -138,6 +150,28 @@ class SFTPNotificationStorage:
         except Exception as e:
             logger.warning("Error during SFTP disconnect", error=str(e))
     
+    def warm_up(self, registration_reference: str = "default"):
+        """
+        Open the connection and exercise a first write ahead of real uploads
+        
+        Creates the target directory for today's files and writes/removes a
+        zero-byte marker so the first notification upload does not pay the
+        SSH handshake and directory creation costs. The connection is left open.
+        
+        Args:
+            registration_reference: Registration whose directory to prepare
+        """
+        self.connect()
+        
+        remote_dir = str(Path(self._generate_remote_path(registration_reference, 0)).parent)
+        self._ensure_remote_directory(remote_dir)
+        
+        warmup_path = f"{remote_dir}/.warmup"
+        self.sftp.putfo(io.BytesIO(b""), warmup_path)
+        self.sftp.remove(warmup_path)
+        
+        logger.debug("SFTP storage warmed up", remote_dir=remote_dir)
+    
     def _load_private_key(self, private_key_path: str, passphrase: Optional[str] = None):
         """Load private key with automatic type detection"""
         
@@ -200,6 +234,11 @@ class SFTPNotificationStorage:
             # Format notifications
             file_content = self._format_notifications(notifications)
             
+            # Compress before upload to cut the bytes sent over the wire
+            if self._compressor:
+                remote_file_path += self._compressed_suffix
+                file_content = self._compressor(file_content.encode('utf-8'))
+            
             # Upload file
             self._upload_file(remote_file_path, file_content)
             
@@ -337,17 +376,14 @@ class SFTPNotificationStorage:
         xml_lines.append('</notifications>')
         return '\\n'.join(xml_lines)
     
-    def _upload_file(self, remote_path: str, content: str):
+    def _upload_file(self, remote_path: str, content: Union[str, bytes]):
         """Upload file content to SFTP server"""
         # Ensure remote directory exists
         remote_dir = str(Path(remote_path).parent)
         self._ensure_remote_directory(remote_dir)
         
-        # Upload file
-        file_like = io.StringIO(content)
-        
         # Convert to bytes for SFTP
-        content_bytes = content.encode('utf-8')
+        content_bytes = content.encode('utf-8') if isinstance(content, str) else content
         bytes_io = io.BytesIO(content_bytes)
         
         logger.debug("Uploading file to SFTP",
@@ -22,6 +22,7 @@ class DNBApiConfig(BaseModel):
     timeout: int = Field(default=30, description="Request timeout in seconds")
     retry_attempts: int = Field(default=3, description="Number of retry attempts")
     backoff_factor: float = Field(default=2.0, description="Exponential backoff factor")
+    pool_maxsize: int = Field(default=64, description="Maximum pooled HTTP connections per host")
 
     @validator('rate_limit')
     def validate_rate_limit(cls, v):
@@ -100,6 +101,7 @@ class SFTPStorageConfig(BaseModel):
     # File format options
     file_format: str = Field(default="json", description="File format (json, csv, xml)")
     compress_files: bool = Field(default=False, description="Compress files before upload")
+    compression: str = Field(default="gzip", description="Compression codec when compress_files is enabled (gzip, zstd)")
     
     # Connection settings
     timeout: int = Field(default=30, description="Connection timeout in seconds")
@@ -116,6 +118,7 @@ class LocalFileStorageConfig(BaseModel):
     base_path: str = Field(default="./notifications", description="Base directory path for storage")
     file_format: str = Field(default="json", description="File format (json, csv, xml)")
     compress_files: bool = Field(default=False, description="Compress files after creation")
+    compression: str = Field(default="gzip", description="Compression codec when compress_files is enabled (gzip, zstd)")
     
     # File organization
     organize_by_date: bool = Field(default=True, description="Organize files by date")
@@ -348,6 +351,7 @@ class ConfigManager:
                 "timeout": int(os.getenv("DNB_TIMEOUT", "30")),
                 "retry_attempts": int(os.getenv("DNB_RETRY_ATTEMPTS", "3")),
                 "backoff_factor": float(os.getenv("DNB_BACKOFF_FACTOR", "2.0")),
+                "pool_maxsize": int(os.getenv("DNB_POOL_MAXSIZE", "64")),
             },
             "database": {
                 "url": os.getenv("DATABASE_URL"),
@@ -391,6 +395,7 @@ class ConfigManager:
                 "remote_base_path": os.getenv("SFTP_REMOTE_PATH", "/notifications"),
                 "file_format": os.getenv("SFTP_FILE_FORMAT", "json"),
                 "compress_files": os.getenv("SFTP_COMPRESS", "false").lower() == "true",
+                "compression": os.getenv("SFTP_COMPRESSION", "gzip"),
                 "timeout": int(os.getenv("SFTP_TIMEOUT", "30")),
                 "max_retries": int(os.getenv("SFTP_MAX_RETRIES", "3")),
                 "organize_by_date": os.getenv("SFTP_ORGANIZE_BY_DATE", "true").lower() == "true",
@@ -401,6 +406,7 @@ class ConfigManager:
                 "base_path": os.getenv("LOCAL_STORAGE_PATH", "./notifications"),
                 "file_format": os.getenv("LOCAL_STORAGE_FORMAT", "json"),
                 "compress_files": os.getenv("LOCAL_STORAGE_COMPRESS", "false").lower() == "true",
+                "compression": os.getenv("LOCAL_STORAGE_COMPRESSION", "gzip"),
                 "organize_by_date": os.getenv("LOCAL_STORAGE_ORGANIZE_BY_DATE", "true").lower() == "true",
                 "organize_by_registration": os.getenv("LOCAL_STORAGE_ORGANIZE_BY_REGISTRATION", "true").lower() == "true",
                 "file_permissions": int(os.getenv("LOCAL_STORAGE_FILE_PERMS", "644"), 8),
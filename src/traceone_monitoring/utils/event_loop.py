@@ -0,0 +1,22 @@
+"""
+Event loop selection for the TraceOne scripts and examples
+"""
+
+
+def install_uvloop() -> bool:
+    """
+    Run later asyncio.run calls on uvloop's faster event loop
+    
+    uvloop is optional (see the 'perf' extra). Without it, for example on
+    Windows, the stdlib event loop is left in place.
+    
+    Returns:
+        True if uvloop's event loop policy was installed
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    
+    uvloop.install()
+    return True
@@ -17,6 +17,7 @@ from traceone_monitoring.utils.config import (
     MonitoringConfig,
     LoggingConfig
 )
+from traceone_monitoring.auth import authenticator as authenticator_module
 from traceone_monitoring.auth.authenticator import DNBAuthenticator
 from traceone_monitoring.api.client import DNBApiClient
 from traceone_monitoring.api.pull_client import PullApiClient
@@ -45,6 +46,14 @@ def event_loop():
     loop.close()
 
 
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    """Keep cached access tokens from leaking between tests"""
+    authenticator_module._token_cache.clear()
+    yield
+    authenticator_module._token_cache.clear()
+
+
 # Configuration fixtures
 @pytest.fixture
 def dnb_api_config():
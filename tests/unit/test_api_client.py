@@ -10,6 +10,7 @@ import requests
 from traceone_monitoring.api.client import (
     DNBApiClient,
     DNBApiError,
+    RateLimiter,
     RateLimitExceededError,
     ServerError,
     NotFoundError
@@ -18,6 +19,58 @@ from traceone_monitoring.auth.authenticator import DNBAuthenticator
 from traceone_monitoring.utils.config import DNBApiConfig
 
 
+@pytest.mark.api
+class TestRateLimiter:
+    """Test cases for the token-bucket rate limiter"""
+
+    @patch('traceone_monitoring.api.client.time.sleep')
+    def test_burst_within_capacity_does_not_sleep(self, mock_sleep):
+        """Calls up to the bucket capacity go out without waiting"""
+        limiter = RateLimiter(5.0)
+        
+        for _ in range(5):
+            limiter.wait()
+        
+        mock_sleep.assert_not_called()
+
+    @patch('traceone_monitoring.api.client.time.sleep')
+    @patch('traceone_monitoring.api.client.time.monotonic', return_value=100.0)
+    def test_empty_bucket_sleeps_for_deficit(self, mock_monotonic, mock_sleep):
+        """Once the bucket is drained each caller waits for its own token"""
+        limiter = RateLimiter(2.0)
+        
+        for _ in range(4):
+            limiter.wait()
+        
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [pytest.approx(0.5), pytest.approx(1.0)]
+
+
+@pytest.mark.api
+class TestAuthHeaderCache:
+    """Test cases for the API client's cached authentication headers"""
+
+    def test_headers_reused_while_token_unchanged(self, dnb_api_config, mock_authenticator):
+        """The same headers dict is served until the token changes"""
+        client = DNBApiClient(mock_authenticator, dnb_api_config)
+        
+        first = client._auth_headers()
+        assert client._auth_headers() is first
+        mock_authenticator.get_auth_headers.assert_called_once()
+
+    def test_headers_rebuilt_after_token_change(self, dnb_api_config, mock_authenticator):
+        """A refreshed token produces fresh headers"""
+        client = DNBApiClient(mock_authenticator, dnb_api_config)
+        client._auth_headers()
+        
+        mock_authenticator.get_token.return_value = "refreshed_token"
+        mock_authenticator.get_auth_headers.return_value = {
+            "Authorization": "Bearer refreshed_token",
+            "Content-Type": "application/json"
+        }
+        
+        assert client._auth_headers()["Authorization"] == "Bearer refreshed_token"
+
+
 @pytest.mark.api
 class TestDNBApiClient:
     """Test cases for DNB API client"""
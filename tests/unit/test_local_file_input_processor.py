@@ -0,0 +1,94 @@
+"""
+Unit tests for local file input discovery
+"""
+
+import pytest
+
+from traceone_monitoring.services.local_file_input_processor import (
+    LocalFileInputConfig,
+    LocalFileInputProcessor
+)
+
+
+@pytest.fixture
+def input_dir(tmp_path):
+    """Create an input directory with one or more files of every type"""
+    for name in (
+        "daily_SEEDFILE_20240101.txt",
+        "daily_HEADER_20240101.json",
+        "daily_exception_20240101.txt",
+        "daily_DunsExport_20240101.txt",
+        "delivery_20240101.zip",
+        "notes.txt",
+    ):
+        (tmp_path / name).write_text("x")
+    return tmp_path
+
+
+def _discover(input_dir, **config):
+    processor = LocalFileInputProcessor(LocalFileInputConfig(
+        input_directory=str(input_dir),
+        auto_archive_processed=False,
+        **config
+    ))
+    discovered = processor.discover_files()
+    return {file_type: sorted(path.name for path in paths)
+            for file_type, paths in discovered.items()}
+
+
+class TestDiscoverFiles:
+    """Test cases for discovering input files by type"""
+
+    def test_discovers_each_type(self, input_dir):
+        """Test every default pattern picks up only its own files"""
+        assert _discover(input_dir) == {
+            "seedfile": ["daily_SEEDFILE_20240101.txt"],
+            "header": ["daily_HEADER_20240101.json"],
+            "exception": ["daily_exception_20240101.txt"],
+            "duns_export": ["daily_DunsExport_20240101.txt"],
+            "zip_archive": ["delivery_20240101.zip"]
+        }
+
+    def test_skips_hidden_files(self, input_dir):
+        """Test dotfiles are not discovered, as with glob"""
+        (input_dir / ".daily_SEEDFILE_20240102.txt").write_text("x")
+        (input_dir / "._delivery_20240101.zip").write_text("x")
+
+        discovered = _discover(input_dir)
+
+        assert discovered["seedfile"] == ["daily_SEEDFILE_20240101.txt"]
+        assert discovered["zip_archive"] == ["delivery_20240101.zip"]
+
+    def test_flat_patterns_do_not_descend(self, input_dir):
+        """Test files inside subdirectories are left to subdirectory patterns"""
+        subdir = input_dir / "processed"
+        subdir.mkdir()
+        (subdir / "daily_SEEDFILE_20231231.txt").write_text("x")
+
+        assert _discover(input_dir)["seedfile"] == ["daily_SEEDFILE_20240101.txt"]
+
+    def test_matching_is_case_sensitive(self, input_dir):
+        """Test patterns match names case-sensitively"""
+        (input_dir / "daily_seedfile_20240102.txt").write_text("x")
+        (input_dir / "daily_EXCEPTION_20240102.txt").write_text("x")
+
+        discovered = _discover(input_dir)
+
+        assert discovered["seedfile"] == ["daily_SEEDFILE_20240101.txt"]
+        assert discovered["exception"] == ["daily_exception_20240101.txt"]
+
+    def test_subdirectory_pattern(self, input_dir):
+        """Test a pattern with a path separator matches inside subdirectories"""
+        subdir = input_dir / "incoming"
+        subdir.mkdir()
+        (subdir / "daily_SEEDFILE_20240102.txt").write_text("x")
+
+        discovered = _discover(input_dir, file_patterns={
+            "seedfile": "incoming/*SEEDFILE*.txt",
+            "zip_archive": "*.zip"
+        })
+
+        assert discovered == {
+            "seedfile": ["daily_SEEDFILE_20240102.txt"],
+            "zip_archive": ["delivery_20240101.zip"]
+        }
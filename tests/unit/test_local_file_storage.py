@@ -0,0 +1,81 @@
+"""
+Unit tests for local file notification storage
+"""
+
+import gzip
+import json
+import pytest
+from datetime import datetime
+from pathlib import Path
+
+from traceone_monitoring.models.notification import (
+    Notification,
+    NotificationType,
+    Organization
+)
+from traceone_monitoring.storage.local_file_handler import (
+    LocalFileConfig,
+    LocalFileNotificationStorage,
+    LocalFileStorageError
+)
+
+
+@pytest.fixture
+def notifications():
+    """Create sample notifications for storage"""
+    return [
+        Notification(
+            type=NotificationType.UPDATE,
+            organization=Organization(duns="123456789"),
+            elements=[],
+            deliveryTimeStamp=datetime.utcnow()
+        )
+    ]
+
+
+class TestLocalFileStorage:
+    """Test cases for local file storage"""
+
+    def test_store_uncompressed(self, tmp_path, notifications):
+        """Test notifications are written as plain JSON by default"""
+        storage = LocalFileNotificationStorage(LocalFileConfig(base_path=str(tmp_path)))
+
+        result = storage.store_notifications(notifications, "test_registration")
+
+        file_path = Path(result["files"][0])
+        assert file_path.suffix == ".json"
+        data = json.loads(file_path.read_text())
+        assert data["metadata"]["notification_count"] == 1
+
+    def test_store_gzip_compressed(self, tmp_path, notifications):
+        """Test gzip compression writes a single .gz file"""
+        config = LocalFileConfig(base_path=str(tmp_path), compress_files=True)
+        storage = LocalFileNotificationStorage(config)
+
+        result = storage.store_notifications(notifications, "test_registration")
+
+        file_path = Path(result["files"][0])
+        assert file_path.name.endswith(".json.gz")
+        assert not file_path.with_suffix("").exists()
+        data = json.loads(gzip.decompress(file_path.read_bytes()))
+        assert data["notifications"][0]["organization"]["duns"] == "123456789"
+
+    def test_store_zstd_compressed(self, tmp_path, notifications):
+        """Test zstd compression writes a .zst file"""
+        zstandard = pytest.importorskip("zstandard")
+        config = LocalFileConfig(base_path=str(tmp_path), compress_files=True, compression="zstd")
+        storage = LocalFileNotificationStorage(config)
+
+        result = storage.store_notifications(notifications, "test_registration")
+
+        file_path = Path(result["files"][0])
+        assert file_path.name.endswith(".json.zst")
+        data = json.loads(zstandard.ZstdDecompressor().decompress(file_path.read_bytes()))
+        assert data["metadata"]["notification_count"] == 1
+
+    def test_unsupported_compression(self, tmp_path):
+        """Test unknown compression codecs are rejected"""
+        config = LocalFileConfig(base_path=str(tmp_path), compress_files=True, compression="lz4")
+
+        with pytest.raises(LocalFileStorageError):
+            LocalFileNotificationStorage(config)
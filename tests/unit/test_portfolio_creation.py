@@ -0,0 +1,33 @@
+"""
+Unit tests for the packed DUNS buffer in the portfolio creation example
+"""
+
+import pytest
+
+from examples.portfolio_creation import DUNS_LENGTH, _pack_duns, _unpack_duns
+
+
+class TestPackedDuns:
+    """Test cases for packing portfolio DUNS into a fixed-width buffer"""
+
+    def test_round_trip(self):
+        """Test packed DUNS unpack to the original list"""
+        duns_list = ["123456789", "987654321", "000000001"]
+
+        packed = _pack_duns(duns_list)
+
+        assert len(packed) == DUNS_LENGTH * len(duns_list)
+        assert _unpack_duns(packed) == duns_list
+        assert _unpack_duns(packed, 2) == duns_list[:2]
+
+    def test_rejects_mixed_widths(self):
+        """Test a short and a long DUNS are rejected even when the total length fits"""
+        with pytest.raises(ValueError):
+            _pack_duns(["12345678", "9876543210"])
+
+    def test_rejects_non_digits(self):
+        """Test DUNS containing anything but ASCII digits are rejected"""
+        with pytest.raises(ValueError):
+            _pack_duns(["12345678X", "987654321"])
+        with pytest.raises(ValueError):
+            _pack_duns(["١٢٣٤٥٦٧٨٩"])
@@ -0,0 +1,58 @@
+"""
+Unit tests for the real-world DUNS test script's notification recording
+"""
+
+import asyncio
+import json
+from datetime import datetime
+
+from traceone_monitoring.models.notification import (
+    Notification,
+    NotificationElement,
+    NotificationType,
+    Organization
+)
+from real_duns_test import RealWorldDUNSTest
+
+
+class TestNotificationRecorder:
+    """Test cases for streaming notification records to the JSON Lines file"""
+
+    def test_notification_recorded(self, tmp_path):
+        """A real notification is summarized and written as one line"""
+        delivered = datetime(2024, 1, 2, 3, 4, 5)
+        notification = Notification(
+            type=NotificationType.UPDATE,
+            organization=Organization(duns="123456789"),
+            elements=[
+                NotificationElement(
+                    element="organization.primaryName",
+                    current="New Company Name",
+                    timestamp=delivered
+                )
+            ],
+            deliveryTimeStamp=delivered
+        )
+
+        # Only the recorder state is needed, not the configured service
+        tester = RealWorldDUNSTest.__new__(RealWorldDUNSTest)
+        tester.notifications_file = tmp_path / "notifications.jsonl"
+        tester.test_results = {"errors": []}
+
+        async def record():
+            async with tester._notification_recorder() as queue:
+                await queue.put(tester._notification_record("test-reg", notification))
+
+        asyncio.run(record())
+
+        lines = tester.notifications_file.read_text().splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0]) == {
+            "registration": "test-reg",
+            "id": str(notification.id),
+            "type": "UPDATE",
+            "duns": "123456789",
+            "delivery_timestamp": delivered.isoformat(),
+            "elements_count": 1
+        }
+        assert tester.test_results["errors"] == []